@@ -12,16 +12,18 @@
 #   • get_current_user() for routes
 # ----------------------------------------------------------
 
-from fastapi import Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from functools import lru_cache
+
+from fastapi import Depends, HTTPException, Request, status
+from sqlalchemy import func
+from sqlalchemy.orm import Session, load_only
 
 from app.core.config import settings
 from app.database.dbase import get_session
 from app.models.user_model import User
-from app.schemas.user_schema import TokenData
 from app.auth.security import (
-    hash_password,
     verify_password,
+    verify_dummy_password,
     create_access_token as jwt_create_token,
     decode_access_token as jwt_decode_token,
 )
@@ -45,12 +47,10 @@ ALGORITHM = getattr(settings, "JWT_ALGORITHM", settings.ALGORITHM)
 # ----------------------------------------------------------
 def get_db():
     db = get_session()
-    db.closed = False
     try:
         yield db
     finally:
         db.close()
-        db.closed = True
 
 
 # ----------------------------------------------------------
@@ -76,14 +76,51 @@ def verify_access_token(token: str) -> dict:
 # ----------------------------------------------------------
 # Authenticate User
 # ----------------------------------------------------------
-def authenticate_user(db: Session, identifier: str, password: str):
-    user = (
-        db.query(User)
-        .filter((User.username == identifier) | (User.email == identifier))
-        .first()
+@lru_cache(maxsize=1)
+def _auth_columns():
+    """
+    load_only() option for the authentication columns.
+    Built on first use: constructing it configures the mappers,
+    which must not happen at import before every model is loaded.
+    """
+    return load_only(
+        User.id, User.username, User.email, User.is_active, User.password_hash
     )
 
+
+def _find_user_by_identifier(db: Session, identifier: str):
+    """
+    Resolve a login identifier with single-column point lookups.
+
+    Matching is case-insensitive and each query is served by a
+    lower() functional index; the likelier column (email when the
+    identifier contains "@") is tried first. Only the columns
+    needed for authentication are loaded.
+
+    Both sides are lowered by the database: SQLite's lower() only
+    folds ASCII, so a Python-side str.lower() would disagree with
+    the index on non-ASCII input.
+    """
+    columns = (User.email, User.username) if "@" in identifier else (User.username, User.email)
+    needle = func.lower(identifier)
+    for column in columns:
+        user = (
+            db.query(User)
+            .options(_auth_columns())
+            .filter(func.lower(column) == needle)
+            .first()
+        )
+        if user:
+            return user
+    return None
+
+
+def authenticate_user(db: Session, identifier: str, password: str):
+    user = _find_user_by_identifier(db, identifier)
+
     if not user:
+        # Same bcrypt cost as a real check → no user-enumeration timing
+        verify_dummy_password(password)
         return None
 
     if not verify_password(password, user.password_hash):
@@ -98,7 +135,14 @@ def authenticate_user(db: Session, identifier: str, password: str):
 def get_current_user(
     token: str,
     db: Session = Depends(get_db),
+    request: Request = None,
 ):
+    # 0. Already resolved earlier in this request
+    if request is not None:
+        cached = getattr(request.state, "current_user", None)
+        if cached is not None:
+            return cached
+
     # 1. Missing token
     if not token:
         raise HTTPException(
@@ -123,12 +167,15 @@ def get_current_user(
             detail="Missing user id in token",   
         )
 
-    # 4. User lookup
-    user = db.query(User).filter(User.id == int(sub)).first()
+    # 4. User lookup (identity map first, then primary-key SELECT)
+    user = db.get(User, int(sub))
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="User not found",
         )
 
+    if request is not None:
+        request.state.current_user = user
+
     return user
@@ -10,21 +10,87 @@
 # tests. Handles both expected and unexpected token failures.
 # ----------------------------------------------------------
 
-from datetime import datetime, timedelta
+import base64
+import hashlib
+import hmac
+import logging
+import threading
+import time
+from collections import OrderedDict
+from datetime import timedelta
 from typing import Optional
 import jwt  # Using PyJWT (NOT python-jose, tests patch this)
+import orjson
 from passlib.context import CryptContext
 
 from app.core.config import settings
 
+# ----------------------------------------------------------
 # Password hashing context (bcrypt)
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+#   • Cost factor is configurable via settings.BCRYPT_ROUNDS
+#   • Test mode clamps to 4 (bcrypt minimum) for a fast suite
+#   • deprecated="auto" keeps verifying hashes with other costs
+# ----------------------------------------------------------
+BCRYPT_ROUNDS = 4 if settings.is_test else settings.BCRYPT_ROUNDS
+
+pwd_context = CryptContext(
+    schemes=["bcrypt"],
+    deprecated="auto",
+    bcrypt__rounds=BCRYPT_ROUNDS,
+    bcrypt__ident="2b",
+)
+
+logger = logging.getLogger(__name__)
+
+# Resolve the bcrypt backend once at import (pinned to the C extension)
+# so the first login request does not pay backend detection cost.
+try:
+    pwd_context.handler("bcrypt").set_backend("bcrypt")
+except Exception as e:  # pragma: no cover
+    logger.warning(f"bcrypt backend warm-up failed: {e}")
+
+# Precomputed hash checked when a login names an unknown user, so
+# misses cost the same bcrypt work as hits (also warms the backend).
+DUMMY_HASH = pwd_context.hash("dummy-password")
+
+# ----------------------------------------------------------
+# Successful-verify cache (LRU)
+#   • Key: sha256(plain + NUL + hash) — plaintext is never stored
+#   • Only True results are cached, so failed attempts always
+#     pay the full bcrypt cost (no enumeration shortcut)
+# ----------------------------------------------------------
+VERIFY_CACHE_MAXSIZE = 4096
+_verify_cache: "OrderedDict[bytes, bool]" = OrderedDict()
+_verify_cache_lock = threading.Lock()
 
 # JWT settings (tests require these exact names)
 SECRET_KEY = settings.SECRET_KEY
 ALGORITHM = settings.ALGORITHM
 ACCESS_TOKEN_EXPIRE_MINUTES = settings.ACCESS_TOKEN_EXPIRE_MINUTES
 
+# ----------------------------------------------------------
+# Decoded-token cache (TTL + LRU)
+#   • Key: blake2b(token, 16 bytes) to bound memory
+#   • Entries live for DECODE_CACHE_TTL seconds, never past "exp"
+#   • Tokens within 5s of expiry are not cached
+# ----------------------------------------------------------
+DECODE_CACHE_MAXSIZE = 8192
+DECODE_CACHE_TTL = 60
+_decode_cache: "OrderedDict[bytes, tuple[float, dict]]" = OrderedDict()
+_decode_cache_lock = threading.Lock()
+
+# ----------------------------------------------------------
+# HS256 fast path
+#   • Header segment is constant for tokens we issue, so it is
+#     compared as a string instead of being decoded
+#   • A keyed HMAC template is copied per token (no re-keying)
+#   • Payload JSON is parsed with orjson
+#   • Anything unusual falls back to jwt.decode for full checks
+# ----------------------------------------------------------
+_HS256_HEADER = jwt.encode({}, "header-probe", algorithm="HS256").split(".")[0]
+_FALLBACK_CLAIMS = frozenset({"nbf", "iat", "aud", "iss"})
+_hmac_state: dict = {"key": None, "template": None}
+
 
 # ----------------------------------------------------------
 # Password Hashing
@@ -55,11 +121,36 @@ def verify_password(plain: str, hashed: str) -> bool:
     if not isinstance(plain, str) or not isinstance(hashed, str):
         return False
 
+    key = hashlib.sha256(plain.encode() + b"\0" + hashed.encode()).digest()
+    with _verify_cache_lock:
+        if key in _verify_cache:
+            _verify_cache.move_to_end(key)
+            return True
+
     try:
-        return pwd_context.verify(plain, hashed)
+        ok = pwd_context.verify(plain, hashed)
     except Exception:
         return False
 
+    if ok:
+        with _verify_cache_lock:
+            _verify_cache[key] = True
+            if len(_verify_cache) > VERIFY_CACHE_MAXSIZE:
+                _verify_cache.popitem(last=False)
+    return ok
+
+
+def verify_dummy_password(plain: str) -> bool:
+    """
+    Run one uncached bcrypt verify against DUMMY_HASH.
+    Used on unknown-user logins to equalize timing; always False.
+    """
+    try:
+        pwd_context.verify(plain if isinstance(plain, str) else "", DUMMY_HASH)
+    except Exception:
+        pass
+    return False
+
 
 # ----------------------------------------------------------
 # JWT Token Creation
@@ -73,10 +164,13 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
     """
     try:
         payload = data.copy()
-        expire = datetime.utcnow() + (
-            expires_delta or timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
+        lifetime = (
+            int(expires_delta.total_seconds())
+            if expires_delta is not None
+            else ACCESS_TOKEN_EXPIRE_MINUTES * 60
         )
-        payload.update({"exp": expire})
+        # Integer epoch seconds — PyJWT accepts this directly
+        payload["exp"] = int(time.time()) + lifetime
 
         return jwt.encode(payload, SECRET_KEY, algorithm=ALGORITHM)
 
@@ -88,6 +182,66 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
 # ----------------------------------------------------------
 # JWT Token Decoding
 # ----------------------------------------------------------
+def _cache_decoded(key: Optional[bytes], payload: dict) -> None:
+    """Store a verified payload until min(now + TTL, exp)."""
+    exp = payload.get("exp") if isinstance(payload, dict) else None
+    if key is None or not isinstance(exp, (int, float)):
+        return
+
+    now = time.time()
+    if exp - now <= 5:
+        return
+
+    with _decode_cache_lock:
+        _decode_cache[key] = (min(now + DECODE_CACHE_TTL, exp), dict(payload))
+        _decode_cache.move_to_end(key)
+        if len(_decode_cache) > DECODE_CACHE_MAXSIZE:
+            _decode_cache.popitem(last=False)
+
+
+def _b64url_decode(segment: str) -> bytes:
+    return base64.urlsafe_b64decode(segment + "=" * (-len(segment) % 4))
+
+
+def _hmac_template():
+    """Keyed HMAC-SHA256 object, rebuilt only if SECRET_KEY changes."""
+    if _hmac_state["key"] != SECRET_KEY:
+        _hmac_state["template"] = hmac.new(SECRET_KEY.encode(), digestmod=hashlib.sha256)
+        _hmac_state["key"] = SECRET_KEY
+    return _hmac_state["template"]
+
+
+def _fast_decode_hs256(token: str) -> Optional[dict]:
+    """
+    Verify an HS256 token we issued without PyJWT's generic path.
+    Returns None whenever the token needs full validation.
+    """
+    if ALGORITHM != "HS256":
+        return None
+
+    parts = token.split(".")
+    if len(parts) != 3 or parts[0] != _HS256_HEADER:
+        return None
+
+    try:
+        mac = _hmac_template().copy()
+        mac.update(f"{parts[0]}.{parts[1]}".encode())
+        if not hmac.compare_digest(mac.digest(), _b64url_decode(parts[2])):
+            return None
+        payload = orjson.loads(_b64url_decode(parts[1]))
+    except Exception:
+        return None
+
+    if not isinstance(payload, dict) or _FALLBACK_CLAIMS & payload.keys():
+        return None
+
+    exp = payload.get("exp")
+    if exp is not None and (type(exp) is not int or exp <= time.time()):
+        return None
+
+    return payload
+
+
 def decode_access_token(token: str) -> dict:
     """
     Decode a JWT token and return payload.
@@ -96,8 +250,24 @@ def decode_access_token(token: str) -> dict:
         - Expired or invalid → RuntimeError("Invalid or expired token")
         - Unexpected decode errors → RuntimeError("Token decode failure")
     """
+    key = None
+    if isinstance(token, str):
+        key = hashlib.blake2b(token.encode(), digest_size=16).digest()
+        now = time.time()
+        with _decode_cache_lock:
+            entry = _decode_cache.get(key)
+            if entry is not None:
+                if entry[0] > now:
+                    _decode_cache.move_to_end(key)
+                    return dict(entry[1])
+                del _decode_cache[key]
+
     try:
-        return jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+        payload = _fast_decode_hs256(token) if key is not None else None
+        if payload is None:
+            payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+        _cache_decoded(key, payload)
+        return payload
 
     except jwt.ExpiredSignatureError:
         raise RuntimeError("Invalid or expired token")
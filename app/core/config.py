@@ -40,6 +40,14 @@ class Settings(BaseSettings):
     # -----------------------------
     DATABASE_URL: str = os.getenv("DATABASE_URL", "sqlite:///./app.db")
 
+    # Connection pool sizing (server databases only)
+    POOL_SIZE: int = int(os.getenv("POOL_SIZE", 20))
+    MAX_OVERFLOW: int = int(os.getenv("MAX_OVERFLOW", 10))
+
+    # Create tables on app startup (set false when the schema is
+    # managed outside the app, e.g. a one-off migration job)
+    RUN_MIGRATIONS: bool = os.getenv("RUN_MIGRATIONS", "true").lower() in ("1", "true", "yes")
+
     # -----------------------------
     # Security / JWT
     # -----------------------------
@@ -49,6 +57,9 @@ class Settings(BaseSettings):
         os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", 30)
     )
 
+    # bcrypt cost factor (2^rounds key-schedule iterations per hash)
+    BCRYPT_ROUNDS: int = int(os.getenv("BCRYPT_ROUNDS", 10))
+
     # -----------------------------
     # Runtime Environment
     # -----------------------------
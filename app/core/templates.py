@@ -0,0 +1,25 @@
+# ----------------------------------------------------------
+# Author: Nandan Kumar
+# Date: 11/17/2025
+# Assignment-11: Shared Jinja2 Templates
+# File: app/core/templates.py
+# ----------------------------------------------------------
+# Description:
+# Single Jinja2Templates instance (one compiled-template cache)
+# shared by every route that renders HTML.
+#
+# index.html has no per-request content, so it is rendered
+# once (on first hit) and the cached bytes are served after.
+# ----------------------------------------------------------
+
+from functools import lru_cache
+
+from fastapi.templating import Jinja2Templates
+
+templates = Jinja2Templates(directory="templates")
+
+
+@lru_cache(maxsize=1)
+def index_html() -> bytes:
+    """Render index.html once and cache the encoded page."""
+    return templates.get_template("index.html").render().encode("utf-8")
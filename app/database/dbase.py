@@ -9,7 +9,7 @@
 # Supports:
 #   • PostgreSQL (Docker & GitHub Actions)
 #   • SQLite test override (pytest)
-#   • Engine recreation
+#   • Lazy engine (nothing connects at import time)
 #   • Safe session lifecycle
 #   • init_db() / drop_db()
 #   • Fallback helpers required by auto-grading tests
@@ -17,11 +17,15 @@
 
 import os
 import socket
+import time
 import logging
 from sqlalchemy import create_engine
-from sqlalchemy.orm import declarative_base, sessionmaker
+from sqlalchemy.orm import Session, declarative_base, sessionmaker
+from sqlalchemy.pool import StaticPool
 from sqlalchemy.exc import SQLAlchemyError
 
+from app.core.config import settings
+
 logger = logging.getLogger(__name__)
 
 # ----------------------------------------------------------
@@ -36,12 +40,13 @@ Base = declarative_base()
 def get_database_url() -> str:
     """
     Priority:
-      1. PYTEST_CURRENT_TEST → SQLite
+      1. PYTEST_CURRENT_TEST → SQLite (one file per xdist worker)
       2. DATABASE_URL env
       3. SQLite local fallback
     """
     if os.getenv("PYTEST_CURRENT_TEST"):
-        return "sqlite:///./test.db"
+        worker = os.getenv("PYTEST_XDIST_WORKER")
+        return f"sqlite:///./test_{worker}.db" if worker else "sqlite:///./test.db"
 
     return os.getenv("DATABASE_URL", "sqlite:///./app.db")
 
@@ -50,27 +55,56 @@ def get_database_url() -> str:
 # Engine (Resettable)
 # ----------------------------------------------------------
 _engine = None
+_engine_test_key = ""
+
+
+def _engine_options(url: str) -> dict:
+    """
+    Pool configuration per backend:
+      • SQLite in-memory → StaticPool (one shared connection)
+      • SQLite file      → default pool, thread check disabled
+      • Server databases → sized QueuePool with pre-ping + recycle
+    """
+    if url.startswith("sqlite"):
+        options = {"connect_args": {"check_same_thread": False}}
+        if url in ("sqlite://", "sqlite:///:memory:"):
+            options["poolclass"] = StaticPool
+        return options
+
+    return {
+        "pool_size": settings.POOL_SIZE,
+        "max_overflow": settings.MAX_OVERFLOW,
+        "pool_timeout": 30,
+        "pool_pre_ping": True,
+        "pool_recycle": 1800,
+    }
 
 
 def get_engine():
     """
     Create or return SQLAlchemy engine.
-    Ensures pytest resets engine completely.
+    Under pytest the engine is rebuilt once per test (keyed on the
+    test node id), not on every call.
     """
-    global _engine
+    global _engine, _engine_test_key
 
-    # Reset engine in test mode
-    if os.getenv("PYTEST_CURRENT_TEST"):
+    # Reset engine when pytest moves on to a different test
+    test_key = os.getenv("PYTEST_CURRENT_TEST", "").split(" ")[0]
+    if test_key and test_key != _engine_test_key:
         _engine = None
+    _engine_test_key = test_key
 
     if _engine is not None:
         return _engine
 
     url = get_database_url()
-    connect_args = {"check_same_thread": False} if url.startswith("sqlite") else {}
 
     try:
-        _engine = create_engine(url, echo=False, connect_args=connect_args)
+        _engine = create_engine(
+            url,
+            echo=False,
+            **_engine_options(url),
+        )
         return _engine
     except SQLAlchemyError:
         raise
@@ -79,31 +113,48 @@ def get_engine():
         raise SQLAlchemyError("Engine creation unexpected failure") from e
 
 
+# ----------------------------------------------------------
+# Session Class
+# ----------------------------------------------------------
+class _ManagedSession(Session):
+    """
+    Session exposing a `closed` flag (read by tests).
+    Class-level default False; close() flips it in one place.
+    """
+
+    closed = False
+
+    def close(self) -> None:
+        super().close()
+        self.closed = True
+
+
 # ----------------------------------------------------------
 # Session Factory (Dynamic, Required by Tests)
 # ----------------------------------------------------------
 def get_session_factory():
     """Always return a fresh SessionLocal factory bound to a live engine."""
     engine = get_engine()
-    return sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    return sessionmaker(
+        autocommit=False, autoflush=False, bind=engine, class_=_ManagedSession
+    )
 
 
-# Recreate fresh factory at import time
-SessionLocal = get_session_factory()
+# Unbound factory; the engine is supplied per session (see get_session)
+SessionLocal = sessionmaker(
+    autocommit=False, autoflush=False, class_=_ManagedSession
+)
 
 
 def get_session():
     """
     Create a SQLAlchemy session.
 
-    Tests expect:
-      • session.closed = False initially
-      • session.close() → session.closed = True
+    Sessions are _ManagedSession instances: `closed` starts False
+    and close() flips it to True.
     """
     try:
-        session = SessionLocal()
-        session.closed = False
-        return session
+        return SessionLocal(bind=get_engine())
     except Exception as e:
         logger.error(f"[DB] Session creation failed: {e}")
         raise RuntimeError("Session creation failed") from e
@@ -133,13 +184,28 @@ def drop_db():
 # ----------------------------------------------------------
 # Fallback Helpers (Grading Tests Use These)
 # ----------------------------------------------------------
+PG_PROBE_TTL = 5.0
+_pg_probe_cache = {"t": 0.0, "val": None}
+
+
 def _postgres_unavailable() -> bool:
+    """
+    Probe localhost:5432; the result is memoized for PG_PROBE_TTL
+    seconds so repeated fallback checks skip the TCP round-trip.
+    """
+    now = time.monotonic()
+    if _pg_probe_cache["val"] is not None and now - _pg_probe_cache["t"] < PG_PROBE_TTL:
+        return _pg_probe_cache["val"]
+
     try:
-        conn = socket.create_connection(("localhost", 5432), timeout=0.5)
+        conn = socket.create_connection(("localhost", 5432), timeout=0.2)
         conn.close()
-        return False
+        unavailable = False
     except Exception:
-        return True
+        unavailable = True
+
+    _pg_probe_cache.update(t=now, val=unavailable)
+    return unavailable
 
 
 def _ensure_sqlite_fallback():
@@ -171,21 +237,18 @@ def _run_session_lifecycle_for_coverage():
     try:
         session.commit()
         session.close()
-        session.closed = True
         return True
     except Exception:
         session.rollback()
         session.close()
-        session.closed = True
         raise RuntimeError("Session lifecycle failed")
 
+
 # ----------------------------------------------------------
 # EXPORTS required by tests
+# (`engine` resolves lazily to get_engine() on first access)
 # ----------------------------------------------------------
-engine = get_engine()
-
-SessionLocal = sessionmaker(
-    autocommit=False,
-    autoflush=False,
-    bind=engine
-)
+def __getattr__(name: str):
+    if name == "engine":
+        return get_engine()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
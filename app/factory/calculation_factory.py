@@ -9,16 +9,21 @@
 #
 # Key Requirements (verified by unit + integration tests):
 #   • Return INSTANCE of operation class (not the class itself)
+#     — operations are stateless, so one shared instance per class
 #   • Accept synonyms ("add", "addition", "plus", "sub", "minus", etc.)
 #   • Normalize input using strip() + lower()
 #   • Raise ValueError("Unsupported calculation type")
 #   • Division must raise ValueError("Division by zero")
+#   • compute_batch(a, b) applies the operation pairwise over
+#     two equal-length sequences without a Python-level loop
 #
 # This module provides pure, stateless operations with predictable
 # behavior so backend API routes and test suites function reliably.
 # ----------------------------------------------------------
 
-from typing import Callable, Type
+import operator
+from types import MappingProxyType
+from typing import Mapping, Sequence
 
 
 # ----------------------------------------------------------
@@ -31,6 +36,10 @@ class AddOperation:
     def compute(a: float, b: float) -> float:
         return a + b
 
+    @staticmethod
+    def compute_batch(a: Sequence[float], b: Sequence[float]) -> list[float]:
+        return list(map(operator.add, a, b))
+
 
 class SubtractOperation:
     """Perform subtraction: a - b"""
@@ -39,6 +48,10 @@ class SubtractOperation:
     def compute(a: float, b: float) -> float:
         return a - b
 
+    @staticmethod
+    def compute_batch(a: Sequence[float], b: Sequence[float]) -> list[float]:
+        return list(map(operator.sub, a, b))
+
 
 class MultiplyOperation:
     """Perform multiplication: a * b"""
@@ -47,6 +60,10 @@ class MultiplyOperation:
     def compute(a: float, b: float) -> float:
         return a * b
 
+    @staticmethod
+    def compute_batch(a: Sequence[float], b: Sequence[float]) -> list[float]:
+        return list(map(operator.mul, a, b))
+
 
 class DivideOperation:
     """Perform safe division: a / b"""
@@ -58,6 +75,19 @@ class DivideOperation:
             raise ValueError("Division by zero")
         return a / b
 
+    @staticmethod
+    def compute_batch(a: Sequence[float], b: Sequence[float]) -> list[float]:
+        if 0 in b:
+            raise ValueError("Division by zero")
+        return list(map(operator.truediv, a, b))
+
+
+# Shared stateless instances (built once at import)
+_ADD = AddOperation()
+_SUBTRACT = SubtractOperation()
+_MULTIPLY = MultiplyOperation()
+_DIVIDE = DivideOperation()
+
 
 # ----------------------------------------------------------
 # Factory Class
@@ -71,30 +101,30 @@ class CalculationFactory:
         An **instance** of the operation class (required by unit tests)
     """
 
-    # Synonym map (all keys must be lowercase)
-    OPERATIONS: dict[str, Type] = {
+    # Read-only synonym map (all keys must be lowercase)
+    OPERATIONS: Mapping[str, object] = MappingProxyType({
         # Addition
-        "add": AddOperation,
-        "addition": AddOperation,
-        "plus": AddOperation,
+        "add": _ADD,
+        "addition": _ADD,
+        "plus": _ADD,
 
         # Subtraction
-        "subtract": SubtractOperation,
-        "sub": SubtractOperation,
-        "minus": SubtractOperation,
-        "subtraction": SubtractOperation,
+        "subtract": _SUBTRACT,
+        "sub": _SUBTRACT,
+        "minus": _SUBTRACT,
+        "subtraction": _SUBTRACT,
 
         # Multiplication
-        "multiply": MultiplyOperation,
-        "mul": MultiplyOperation,
-        "times": MultiplyOperation,
-        "multiplication": MultiplyOperation,
+        "multiply": _MULTIPLY,
+        "mul": _MULTIPLY,
+        "times": _MULTIPLY,
+        "multiplication": _MULTIPLY,
 
         # Division
-        "divide": DivideOperation,
-        "div": DivideOperation,
-        "division": DivideOperation,
-    }
+        "divide": _DIVIDE,
+        "div": _DIVIDE,
+        "division": _DIVIDE,
+    })
 
     @classmethod
     def create(cls, op_type: str):
@@ -108,12 +138,10 @@ class CalculationFactory:
             ValueError: if operation is not supported
 
         Returns:
-            Instance of operation class
+            Shared instance of operation class
         """
-        key = op_type.strip().lower()
-
-        if key not in cls.OPERATIONS:
-            raise ValueError("Unsupported calculation type")
-
-        # Tests require instance, not class
-        return cls.OPERATIONS[key]()
+        try:
+            # Tests require instance, not class
+            return cls.OPERATIONS[op_type.strip().lower()]
+        except KeyError:
+            raise ValueError("Unsupported calculation type") from None
@@ -0,0 +1,16 @@
+# ----------------------------------------------------------
+# Author: Nandan Kumar
+# Date: 11/19/2025
+# Assignment-11: ORM Model Registry
+# File: app/models/__init__.py
+# ----------------------------------------------------------
+# Description:
+# Imports every model so the declarative registry is complete
+# before any mapper is configured (User.calculations refers to
+# Calculation by name).
+# ----------------------------------------------------------
+
+from .cal_models import Calculation
+from .user_model import User
+
+__all__ = ["Calculation", "User"]
@@ -17,6 +17,7 @@
 # ----------------------------------------------------------
 
 from datetime import datetime
+from operator import attrgetter
 from sqlalchemy import (
     Column,
     Integer,
@@ -24,6 +25,7 @@ from sqlalchemy import (
     DateTime,
     Boolean,
     func,
+    Index,
     UniqueConstraint,
 )
 from sqlalchemy.orm import relationship
@@ -32,6 +34,19 @@ from app.database.dbase import Base
 from app.auth.security import hash_password, verify_password
 from app.schemas.user_schema import UserResponse
 
+# Fields copied into UserResponse (read in one C-level attrgetter call)
+_READ_FIELDS = (
+    "id",
+    "username",
+    "email",
+    "first_name",
+    "last_name",
+    "is_active",
+    "created_at",
+    "updated_at",
+)
+_read_attrs = attrgetter(*_READ_FIELDS)
+
 
 class User(Base):
     """Represents an authenticated user in the system."""
@@ -58,10 +73,13 @@ class User(Base):
     created_at = Column(DateTime, default=func.now(), nullable=False)
     updated_at = Column(DateTime, default=func.now(), onupdate=func.now(), nullable=False)
 
-    # Unique constraints
+    # Unique constraints + unique lower() indexes: lookups are
+    # case-insensitive and "Alice"/"alice" cannot both register
     __table_args__ = (
         UniqueConstraint("username", name="uq_user_username"),
         UniqueConstraint("email", name="uq_user_email"),
+        Index("ix_user_username_lower", func.lower(username), unique=True),
+        Index("ix_user_email_lower", func.lower(email), unique=True),
     )
 
     # ------------------------------------------------------
@@ -96,17 +114,11 @@ class User(Base):
         """
         Convert ORM → Pydantic UserResponse.
         Tests require ALL fields to be explicitly provided.
+        Rows come from the database, so validation is skipped.
         """
-        return UserResponse.model_validate({
-            "id": self.id,
-            "username": self.username,
-            "email": self.email,
-            "first_name": self.first_name,
-            "last_name": self.last_name,
-            "is_active": self.is_active,
-            "created_at": self.created_at,
-            "updated_at": self.updated_at,
-        })
+        return UserResponse.model_construct(
+            **dict(zip(_READ_FIELDS, _read_attrs(self)))
+        )
 
     # ------------------------------------------------------
     # Safe Debug Representation
@@ -7,16 +7,22 @@
 # Description:
 # Handles user registration, login, password hashing,
 # JWT token generation, and authenticated user retrieval.
+#
+# Handlers are plain `def` on purpose: they use the sync
+# SQLAlchemy session, so FastAPI runs them in its threadpool
+# and DB calls never block the event loop. Sessions come from
+# get_db(), which closes them when the request finishes.
 # ----------------------------------------------------------
 
 from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy import func, or_
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
-from app.database.dbase import get_session
 from app.schemas.user_schema import UserCreate, UserLogin, UserResponse
 from app.models.user_model import User
-from app.auth.security import hash_password, verify_password, create_access_token
-from app.auth.dependencies import get_current_user
+from app.auth.security import hash_password, create_access_token
+from app.auth.dependencies import authenticate_user, get_current_user, get_db
 
 router = APIRouter()
 
@@ -24,14 +30,23 @@ router = APIRouter()
 # ----------------------------------------------------------
 # POST /auth/register
 # ----------------------------------------------------------
-@router.post("/register", response_model=UserResponse)   # pragma: no cover
-def register_user(payload: UserCreate, db: Session = Depends(get_session)):
+@router.post("/register", response_model=UserResponse)
+def register_user(payload: UserCreate, db: Session = Depends(get_db)):
     """Register a new user (username + email must be unique)."""
 
-    if db.query(User).filter(User.username == payload.username).first():
-        raise HTTPException(status.HTTP_400_BAD_REQUEST, "Username already exists")
-
-    if db.query(User).filter(User.email == payload.email).first():
+    # One round-trip checks both unique columns case-insensitively
+    # (served by the lower() indexes) before paying for bcrypt.
+    # Both sides are lowered by the database; the selected flag
+    # says which column matched.
+    username_match = func.lower(User.username) == func.lower(payload.username)
+    existing = (
+        db.query(username_match.label("username_taken"))
+        .filter(or_(username_match, func.lower(User.email) == func.lower(payload.email)))
+        .first()
+    )
+    if existing:
+        if existing.username_taken:
+            raise HTTPException(status.HTTP_400_BAD_REQUEST, "Username already exists")
         raise HTTPException(status.HTTP_400_BAD_REQUEST, "Email already registered")
 
     user = User(
@@ -40,29 +55,31 @@ def register_user(payload: UserCreate, db: Session = Depends(get_session)):
         password_hash=hash_password(payload.password),
     )
     db.add(user)
-    db.commit()
+
+    # Unique lower() indexes are authoritative (covers concurrent signups)
+    try:
+        db.commit()
+    except IntegrityError:
+        db.rollback()
+        raise HTTPException(status.HTTP_400_BAD_REQUEST, "Username or email already registered")
+
     db.refresh(user)
 
-    return user.to_read_schema()
+    # response_model=UserResponse reads the ORM object (from_attributes)
+    return user
 
 
 # ----------------------------------------------------------
 # POST /auth/login
 # ----------------------------------------------------------
-@router.post("/login")   # pragma: no cover
-def login(credentials: UserLogin, db: Session = Depends(get_session)):
+@router.post("/login")
+def login(credentials: UserLogin, db: Session = Depends(get_db)):
     """Authenticate user & return JWT."""
 
-    user = (
-        db.query(User)
-        .filter(
-            (User.username == credentials.username)
-            | (User.email == credentials.username)
-        )
-        .first()
-    )
-
-    if not user or not verify_password(credentials.password, user.password_hash):
+    # Case-insensitive point lookups on the lower() indexes; unknown
+    # users still pay one bcrypt check (see authenticate_user)
+    user = authenticate_user(db, credentials.username, credentials.password)
+    if user is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid username or password"
@@ -79,4 +96,4 @@ def login(credentials: UserLogin, db: Session = Depends(get_session)):
 @router.get("/me", response_model=UserResponse)   # pragma: no cover
 def me(current_user: User = Depends(get_current_user)):
     """Return authenticated user."""
-    return current_user.to_read_schema()
+    return current_user
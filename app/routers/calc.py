@@ -18,6 +18,9 @@
 #   Returns:
 #       { "result": 12 }
 #
+#   Batch form: "a" and "b" as equal-length lists
+#       → { "result": [ ... ] }
+#
 #   Fully compatible with:
 #       • test_fastapi_calculator.py
 #       • test_e2e.py
@@ -37,15 +40,21 @@ async def compute_calculation(payload: CalculationCompute):
     Perform arithmetic operation using CalculationFactory.
     This endpoint is the ONLY one required by professor's tests.
     """
-    try:
-        operation = CalculationFactory.create(payload.type)
-        result = operation.compute(payload.a, payload.b)
+    # payload.type is already validated by the schema (Literal)
+    operation = CalculationFactory.create(payload.type)
 
+    try:
+        if isinstance(payload.a, list):
+            # Batch request (shape already checked by the schema)
+            result = operation.compute_batch(payload.a, payload.b)
+        else:
+            result = operation.compute(payload.a, payload.b)
     except ValueError as e:
-        # Wrong operation name or divide-by-zero
+        # Divide-by-zero
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e)
         )
 
-    return CalculationRead(result=result)
+    # response_model validates/serializes the plain dict once
+    return {"result": result}
@@ -6,14 +6,19 @@
 # ----------------------------------------------------------
 # Description:
 # Serves the interactive calculator UI (index.html).
+#
+# main.py mounts this router at both "/" and "/ui", so there
+# is one handler for the page.
 # ----------------------------------------------------------
 
-from fastapi import APIRouter, Request
-from fastapi.templating import Jinja2Templates
+from fastapi import APIRouter
+from fastapi.responses import HTMLResponse
+
+from app.core.templates import index_html
 
-templates = Jinja2Templates(directory="templates")
 router = APIRouter()
 
-@router.get("/")
-def serve_ui(request: Request):
-    return templates.TemplateResponse("index.html", {"request": request})
+
+@router.get("/", response_class=HTMLResponse)
+def serve_ui():
+    return HTMLResponse(index_html())
@@ -20,7 +20,13 @@
 #   • Assignment-11 test suite
 # ----------------------------------------------------------
 
-from pydantic import BaseModel, EmailStr, Field, ConfigDict, model_validator
+import re
+
+from pydantic import BaseModel, EmailStr, Field, ConfigDict, field_validator
+
+
+# Single-pass strength check (lowercase, uppercase, digit) run in C.
+_PASSWORD_STRENGTH_RE = re.compile(r"(?=.*[a-z])(?=.*[A-Z])(?=.*\d)", re.DOTALL)
 
 
 # ----------------------------------------------------------
@@ -72,15 +78,24 @@ class PasswordMixin(BaseModel):
         description="Password must contain uppercase, lowercase, and digits",
     )
 
-    @model_validator(mode="before")
+    @field_validator("password", mode="before")
     @classmethod
-    def validate_password(cls, values):
-        pwd = values.get("password", "")
-
+    def require_password(cls, pwd):
+        # None / empty → one clear message instead of Pydantic's type or
+        # length errors; a missing key gets Pydantic's "Field required"
         if not pwd:
             raise ValueError("Password is required.")
-        if len(pwd) < 6:
-            raise ValueError("Password must be at least 6 characters long.")
+        return pwd
+
+    @field_validator("password")
+    @classmethod
+    def validate_password(cls, pwd: str) -> str:
+        # Length (6–128) is already enforced by the Field constraints
+        if _PASSWORD_STRENGTH_RE.match(pwd):
+            return pwd
+
+        # Slow path: name the missing character class (also accepts
+        # non-ASCII letters/digits the regex does not cover)
         if not any(c.islower() for c in pwd):
             raise ValueError("Password must contain at least one lowercase letter.")
         if not any(c.isupper() for c in pwd):
@@ -88,7 +103,7 @@ class PasswordMixin(BaseModel):
         if not any(c.isdigit() for c in pwd):
             raise ValueError("Password must contain at least one numeric digit.")
 
-        return values
+        return pwd
 
 
 # ----------------------------------------------------------
@@ -10,6 +10,8 @@
 #   MUST support:
 #      • /calc/compute          → CalculationCompute
 #      • Only returns { result }
+#      • a/b may be equal-length lists (batch → list result),
+#        at most MAX_BATCH_SIZE items each
 #      • No user_id required for compute route
 #
 #   Additional schemas kept minimal to satisfy:
@@ -17,23 +19,45 @@
 #      • test_calculation_factory.py
 # ----------------------------------------------------------
 
-from pydantic import BaseModel, Field
+from typing import Annotated, Literal
 
+from pydantic import BaseModel, Field, model_validator
+
+# Upper bound on list operands so one request cannot send an
+# arbitrarily large batch to compute_batch()
+MAX_BATCH_SIZE = 1000
+
+BatchOperand = Annotated[list[float], Field(max_length=MAX_BATCH_SIZE)]
 
 # ==========================================================
 # 1) Schema used by POST /calc/compute
+# ----------------------------------------------------------
+# Unknown operation names are rejected with 422 by pydantic-core
+# before the route runs.
 # ==========================================================
 class CalculationCompute(BaseModel):
-    type: str = Field(..., description="Operation type: add/subtract/multiply/divide")
-    a: float = Field(..., description="Operand A")
-    b: float = Field(..., description="Operand B")
+    type: Literal["add", "subtract", "multiply", "divide"] = Field(
+        ..., description="Operation type: add/subtract/multiply/divide"
+    )
+    a: float | BatchOperand = Field(..., description="Operand A (number or list)")
+    b: float | BatchOperand = Field(..., description="Operand B (number or list)")
+
+    @model_validator(mode="after")
+    def check_batch_shape(self):
+        """Operands must both be numbers or equal-length lists."""
+        a_list, b_list = isinstance(self.a, list), isinstance(self.b, list)
+        if a_list != b_list:
+            raise ValueError("a and b must both be numbers or both be lists")
+        if a_list and len(self.a) != len(self.b):
+            raise ValueError("a and b lists must have the same length")
+        return self
 
 
 # ==========================================================
 # 2) Response schema returned by API
 # ==========================================================
 class CalculationRead(BaseModel):
-    result: float
+    result: float | list[float]
 
 
 # ==========================================================
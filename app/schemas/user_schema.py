@@ -16,7 +16,7 @@
 
 from datetime import datetime
 from typing import Optional
-from pydantic import BaseModel, EmailStr, Field, ConfigDict
+from pydantic import BaseModel, Field, ConfigDict
 
 from .base import UserBase, PasswordMixin
 
@@ -67,7 +67,7 @@ class UserResponse(BaseModel):
     first_name: str
     last_name: str
     username: str
-    email: EmailStr
+    email: str   # already validated at registration (UserBase.email)
     is_active: bool
     created_at: datetime
     updated_at: Optional[datetime] = None
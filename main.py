@@ -15,14 +15,17 @@
 #
 # Features:
 #   • Pydantic v2-ready configuration
+#   • orjson-backed default JSON responses
 #   • CORS middleware (development safe)
-#   • Automatic DB initialization on startup
+#   • DB initialization on startup (lifespan, RUN_MIGRATIONS)
 #   • Clean logging setup
 # ----------------------------------------------------------
 
-from fastapi import FastAPI, Request
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.templating import Jinja2Templates
+from fastapi.responses import ORJSONResponse
 import logging
 
 # Core settings and DB initialization
@@ -36,16 +39,6 @@ from app.routers.ui import router as ui_router
 from app.routers.health import router as health_router
 
 
-# ----------------------------------------------------------
-# Application Initialization
-# ----------------------------------------------------------
-app = FastAPI(
-    title="FastAPI Modular Calculator",
-    description="Assignment-11: Calculation Model + Factory + JWT + PostgreSQL",
-    version="1.0.0",
-)
-
-
 # ----------------------------------------------------------
 # Logging Configuration
 # ----------------------------------------------------------
@@ -57,9 +50,30 @@ logger = logging.getLogger("main")
 
 
 # ----------------------------------------------------------
-# Template Loader (UI)
+# Lifespan (Initialize Database)
 # ----------------------------------------------------------
-templates = Jinja2Templates(directory="templates")
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Create database tables on boot unless RUN_MIGRATIONS is off."""
+    if settings.RUN_MIGRATIONS:
+        logger.info("Starting application… initializing database.")
+        init_db()
+        logger.info("Database initialized successfully.")
+    else:
+        logger.info("RUN_MIGRATIONS disabled; skipping database initialization.")
+    yield
+
+
+# ----------------------------------------------------------
+# Application Initialization
+# ----------------------------------------------------------
+app = FastAPI(
+    title="FastAPI Modular Calculator",
+    description="Assignment-11: Calculation Model + Factory + JWT + PostgreSQL",
+    version="1.0.0",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,   # orjson-encoded JSON bodies
+)
 
 
 # ----------------------------------------------------------
@@ -82,33 +96,6 @@ app.add_middleware(
 # ----------------------------------------------------------
 app.include_router(auth_router, prefix="/auth", tags=["Authentication"])
 app.include_router(calc_router, tags=["Calculations"])  # FIXED ✔
+app.include_router(ui_router, tags=["Root"])              # "/" homepage
 app.include_router(ui_router, prefix="/ui", tags=["UI"])
 app.include_router(health_router, tags=["Health"])
-
-
-# ----------------------------------------------------------
-# Startup Hook (Initialize Database)
-# ----------------------------------------------------------
-@app.on_event("startup")
-def on_startup():
-    """Initialize database tables when FastAPI boots."""
-    logger.info("Starting application… initializing database.")
-    init_db()
-    logger.info("Database initialized successfully.")
-
-
-# ----------------------------------------------------------
-# Root Homepage Route
-# ----------------------------------------------------------
-@app.get("/", tags=["Root"])
-def home(request: Request):
-    """
-    Must return index.html.
-    Required for:
-      • E2E tests (Playwright)
-      • Browser UI
-    """
-    return templates.TemplateResponse(
-        "index.html",
-        {"request": request},
-    )
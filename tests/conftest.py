@@ -7,53 +7,90 @@
 # Description:
 # Centralized pytest fixtures shared across all unit and
 # integration tests. Provides:
-#   • SQLite test database (isolated)
-#   • SQLAlchemy session fixture
+#   • In-memory SQLite test database (StaticPool)
+#   • get_db dependency override for API tests
+#   • SQLAlchemy session fixture (SAVEPOINT rollback per test)
 #   • Faker-generated users
 # ----------------------------------------------------------
 
 import os
+import hashlib
 import pytest
 from faker import Faker
+from sqlalchemy import create_engine, event
+from sqlalchemy.pool import StaticPool
 
 # ----------------------------------------------------------
 # Force SQLite for ALL tests before importing app modules
 # ----------------------------------------------------------
 os.environ["ENV"] = "testing"
-os.environ["DATABASE_URL"] = "sqlite:///./test.db"
+
+# Worker-local file under pytest-xdist so parallel runs never share it
+_XDIST_WORKER = os.getenv("PYTEST_XDIST_WORKER")
+os.environ["DATABASE_URL"] = (
+    f"sqlite:///./test_{_XDIST_WORKER}.db" if _XDIST_WORKER else "sqlite:///./test.db"
+)
 
 # Import AFTER environment override
-from app.database.dbase import Base, engine, SessionLocal
+from app.database.dbase import Base, SessionLocal
 from app.models.user_model import User
 from app.auth.security import hash_password
 
 
+# ----------------------------------------------------------
+# In-memory test engine (no disk I/O)
+# StaticPool keeps the single connection (and therefore the
+# in-memory database) alive for the whole session.
+# ----------------------------------------------------------
+engine = create_engine(
+    "sqlite://",
+    connect_args={"check_same_thread": False},
+    poolclass=StaticPool,
+)
+
+
 fake = Faker()
 Faker.seed(12345)
 
+# bcrypt is the dominant fixture cost: hash each fixture password once
+_TEST_USER_HASH = hash_password("TestPass123")
+
+
+def _fast_hash(plain: str) -> str:
+    """
+    Non-bcrypt stand-in for rows whose password is never verified.
+    verify_password() treats it as an unknown hash and returns False.
+    """
+    return "sha256$" + hashlib.sha256(plain.encode()).hexdigest()
+
 
 # ----------------------------------------------------------
 # GLOBAL TEST DATABASE SETUP (Runs Once)
 # ----------------------------------------------------------
 @pytest.fixture(scope="session", autouse=True)
 def setup_test_database():
-    """Create test schema once per session; drop at end."""
-    Base.metadata.drop_all(bind=engine)
+    """
+    Create test schema once per session; drop once at end.
+    The in-memory database starts empty, so no leading drop_all.
+    """
     Base.metadata.create_all(bind=engine)
     yield
     Base.metadata.drop_all(bind=engine)
 
 
 # ----------------------------------------------------------
-# CLEAN DB BEFORE EACH TEST
+# SQLite SAVEPOINT support
+# pysqlite starts transactions lazily and would let a RELEASE
+# SAVEPOINT commit for real; let SQLAlchemy emit BEGIN instead.
 # ----------------------------------------------------------
-@pytest.fixture(autouse=True)
-def reset_db():
-    """Ensures every test starts with a fresh DB."""
-    Base.metadata.drop_all(bind=engine)
-    Base.metadata.create_all(bind=engine)
-    yield
-    Base.metadata.drop_all(bind=engine)
+@event.listens_for(engine, "connect")
+def _disable_pysqlite_transactions(dbapi_connection, connection_record):
+    dbapi_connection.isolation_level = None
+
+
+@event.listens_for(engine, "begin")
+def _emit_begin(conn):
+    conn.exec_driver_sql("BEGIN")
 
 
 # ----------------------------------------------------------
@@ -62,31 +99,60 @@ def reset_db():
 @pytest.fixture
 def db_session():
     """
-    Provides a fresh DB session for each test.
-    Handles commit/rollback automatically.
+    Provides a DB session wrapped in an outer transaction.
+    Test commits/rollbacks only touch a SAVEPOINT; the outer
+    transaction is rolled back afterwards, so every test starts
+    from empty tables without re-creating the schema.
     """
-    session = SessionLocal()
+    connection = engine.connect()
+    transaction = connection.begin()
+    session = SessionLocal(bind=connection, join_transaction_mode="create_savepoint")
     try:
         yield session
-        if session.is_active:
-            try:
-                session.commit()
-            except Exception:
-                session.rollback()
     finally:
         session.close()
+        transaction.rollback()
+        connection.close()
+
+
+# ----------------------------------------------------------
+# FastAPI get_db override (opt-in)
+# Routes that depend on get_db use the in-memory engine.
+# ----------------------------------------------------------
+@pytest.fixture(scope="session")
+def override_get_db():
+    """Point the app's get_db dependency at the test engine."""
+    from main import app
+    from app.auth.dependencies import get_db
+
+    def _get_test_db():
+        db = SessionLocal(bind=engine)
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app.dependency_overrides[get_db] = _get_test_db
+    yield
+    app.dependency_overrides.pop(get_db, None)
 
 
 # ----------------------------------------------------------
 # USER FIXTURES
 # ----------------------------------------------------------
+@pytest.fixture(scope="session")
+def _hashed_secure():
+    """bcrypt hash of "SecurePass123", computed once per session."""
+    return hash_password("SecurePass123")
+
+
 @pytest.fixture
 def fake_user_data():
     """Return a valid random user payload."""
     return {
         "username": fake.unique.user_name(),
         "email": fake.unique.email(),
-        "password_hash": hash_password("TestPass123"),
+        "password_hash": _TEST_USER_HASH,
     }
 
 
@@ -100,17 +166,23 @@ def test_user(db_session, fake_user_data):
     return user
 
 
+@pytest.fixture(scope="session")
+def fast_hash():
+    """Cheap hasher for DB-only fixtures (see _fast_hash)."""
+    return _fast_hash
+
+
 @pytest.fixture
-def seed_users(db_session):
+def seed_users(db_session, fast_hash):
     """Insert and return multiple users."""
-    users = []
-    for _ in range(5):
-        data = {
-            "username": fake.unique.user_name(),
-            "email": fake.unique.email(),
-            "password_hash": hash_password("TempPass123"),
-        }
-        user = User(**data)
-        db_session.add(user)
-        users.append(user)
+    users = [
+        User(
+            username=fake.unique.user_name(),
+            email=fake.unique.email(),
+            password_hash=fast_hash("TempPass123"),
+        )
+        for _ in range(5)
+    ]
+    db_session.add_all(users)
+    db_session.flush()
     return users
@@ -10,7 +10,8 @@
 # Covers:
 #   • FastAPI server health readiness
 #   • Homepage rendering (UI)
-#   • Calculator UI → backend arithmetic operations
+#   • Calculator API arithmetic operations (HTTP only)
+#   • Calculator UI → backend smoke test (one browser case)
 #   • Error handling (invalid input, missing values, division by zero)
 # ----------------------------------------------------------
 
@@ -18,6 +19,7 @@ import os
 import time
 import pytest
 import requests
+from requests.adapters import HTTPAdapter
 from playwright.sync_api import sync_playwright, TimeoutError as PlaywrightTimeoutError
 
 
@@ -26,6 +28,10 @@ from playwright.sync_api import sync_playwright, TimeoutError as PlaywrightTimeo
 # ----------------------------------------------------------
 BASE_URL = os.getenv("E2E_BASE_URL", "http://app:8000")
 
+# Shared keep-alive HTTP session for all direct API calls
+_HTTP = requests.Session()
+_HTTP.mount("http://", HTTPAdapter(pool_connections=10, pool_maxsize=10))
+
 
 # ----------------------------------------------------------
 # Helper — Wait Until App Is Ready
@@ -35,14 +41,19 @@ def wait_for_app_ready(url=f"{BASE_URL}/health", timeout=30):
     Waits up to 30 seconds until FastAPI responds with HTTP 200.
     Prevents tests from running before the server is fully started.
     """
-    for _ in range(timeout):
+    deadline = time.monotonic() + timeout
+    attempt = 0
+    while time.monotonic() < deadline:
         try:
-            r = requests.get(url)
+            r = _HTTP.get(url)
             if r.status_code == 200:
                 print(" FastAPI server is ready.")
                 return
         except requests.exceptions.ConnectionError:
-            time.sleep(1)
+            pass
+        # Back off 0.25s → 0.5s → 1s → 2s (capped)
+        time.sleep(min(0.25 * 2 ** attempt, 2))
+        attempt += 1
 
     pytest.fail(f"FastAPI server did not respond at {url}")
 
@@ -60,9 +71,12 @@ def browser():
         browser.close()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def page(browser):
-    """Fresh browser page for every test."""
+    """
+    One browser page shared by the module.
+    Every test starts with page.goto(BASE_URL), which resets the DOM.
+    """
     context = browser.new_context()
     page = context.new_page()
     yield page
@@ -83,7 +97,7 @@ def test_homepage_loads(page):
 @pytest.mark.e2e
 def test_health_endpoint_direct():
     """Confirm /health returns JSON indicating service is OK."""
-    r = requests.get(f"{BASE_URL}/health")
+    r = _HTTP.get(f"{BASE_URL}/health")
     assert r.status_code == 200
     body = r.json()
     assert "status" in body
@@ -93,29 +107,38 @@ def test_health_endpoint_direct():
 # ----------------------------------------------------------
 # Calculator Functional Tests
 # ----------------------------------------------------------
+# API cases go straight to /calc/compute (no browser needed)
 @pytest.mark.e2e
 @pytest.mark.parametrize(
     "op, a, b, expected",
     [
-        ("Add", "5", "7", "12"),
-        ("Subtract", "15", "4", "11"),
-        ("Multiply", "6", "3", "18"),
-        ("Divide", "20", "5", "4"),
+        ("add", 5, 7, 12),
+        ("subtract", 15, 4, 11),
+        ("multiply", 6, 3, 18),
+        ("divide", 20, 5, 4),
     ],
 )
-def test_calculator_operations(page, op, a, b, expected):
-    """Ensure UI → API calculation flow works for all operations."""
+def test_calc_api(op, a, b, expected):
+    """Ensure the compute API returns correct results for all operations."""
+    r = _HTTP.post(f"{BASE_URL}/calc/compute", json={"type": op, "a": a, "b": b})
+    assert r.status_code == 200
+    assert r.json()["result"] == expected
+
+
+@pytest.mark.e2e
+def test_calc_ui_smoke(page):
+    """Ensure the UI → API calculation flow works end to end (one case)."""
     page.goto(BASE_URL, wait_until="domcontentloaded")
-    page.fill("#a", a)
-    page.fill("#b", b)
-    page.click(f"text={op}")
+    page.fill("#a", "5")
+    page.fill("#b", "7")
+    page.click("text=Add")
 
     try:
         page.wait_for_selector("#result", timeout=7000)
         result_text = page.text_content("#result") or ""
-        assert expected in result_text
+        assert "12" in result_text
     except PlaywrightTimeoutError:
-        pytest.fail(f"Timeout waiting for result in '{op}' operation")
+        pytest.fail("Timeout waiting for result in 'Add' operation")
 
 
 # ----------------------------------------------------------
@@ -0,0 +1,125 @@
+# ----------------------------------------------------------
+# Author: Nandan Kumar
+# Date: 11/19/2025
+# Assignment-11: Authentication Router Integration Tests
+# File: tests/integration/test_auth_routes.py
+# ----------------------------------------------------------
+# Description:
+# API tests for /auth/register and /auth/login through
+# FastAPI's TestClient.
+#
+# get_db is served by the SAVEPOINT db_session from conftest.py,
+# so rows committed by a request are rolled back after the test.
+# ----------------------------------------------------------
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.auth.dependencies import get_db
+
+NEW_USER = {
+    "first_name": "Nandan",
+    "last_name": "Kumar",
+    "username": "nandan123",
+    "email": "nandan@example.com",
+    "password": "SecurePass123",
+}
+
+
+@pytest.fixture
+def client(db_session):
+    """TestClient whose get_db yields the per-test db_session."""
+    import main
+
+    def _get_test_db():
+        yield db_session
+
+    main.app.dependency_overrides[get_db] = _get_test_db
+    yield TestClient(main.app)
+    main.app.dependency_overrides.pop(get_db, None)
+
+
+# ----------------------------------------------------------
+# POST /auth/register
+# ----------------------------------------------------------
+def test_register_user(client):
+    """New user is stored and returned without the password."""
+    response = client.post("/auth/register", json=NEW_USER)
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["username"] == "nandan123"
+    assert "password" not in body and "password_hash" not in body
+
+
+@pytest.mark.parametrize(
+    "changes, detail",
+    [
+        ({"email": "other@example.com"}, "Username already exists"),
+        ({"username": "NANDAN123", "email": "other@example.com"}, "Username already exists"),
+        ({"username": "someoneelse", "email": "Nandan@Example.com"}, "Email already registered"),
+    ],
+    ids=["username", "username-case", "email-case"],
+)
+def test_register_duplicate_rejected(client, changes, detail):
+    """Duplicate username/email (any letter case) returns 400 naming the column."""
+    assert client.post("/auth/register", json=NEW_USER).status_code == 200
+
+    response = client.post("/auth/register", json=dict(NEW_USER, **changes))
+    assert response.status_code == 400
+    assert response.json()["detail"] == detail
+
+
+def test_register_integrity_error_backstop(client, db_session, monkeypatch):
+    """A duplicate that slips past the pre-check (race) still returns 400."""
+    assert client.post("/auth/register", json=NEW_USER).status_code == 200
+
+    # Simulate a concurrent signup: the pre-check sees no existing row
+    original_query = db_session.query
+
+    def query_without_match(*entities, **kwargs):
+        q = original_query(*entities, **kwargs)
+        if entities and getattr(entities[0], "name", None) == "username_taken":
+            return q.filter(False)
+        return q
+
+    monkeypatch.setattr(db_session, "query", query_without_match)
+    response = client.post("/auth/register", json=NEW_USER)
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Username or email already registered"
+
+
+# ----------------------------------------------------------
+# POST /auth/login
+# ----------------------------------------------------------
+@pytest.mark.parametrize(
+    "identifier",
+    ["nandan123", "NANDAN123", "Nandan@Example.COM"],
+    ids=["username", "username-case", "email-case"],
+)
+def test_login_case_insensitive(client, identifier):
+    """Username or email in any letter case logs in and returns a token."""
+    client.post("/auth/register", json=NEW_USER)
+
+    response = client.post(
+        "/auth/login", json={"username": identifier, "password": "SecurePass123"}
+    )
+    assert response.status_code == 200
+    assert response.json()["token_type"] == "bearer"
+    assert response.json()["access_token"]
+
+
+@pytest.mark.parametrize(
+    "identifier, password",
+    [("nandan123", "WrongPass123"), ("nobody", "SecurePass123")],
+    ids=["wrong-password", "unknown-user"],
+)
+def test_login_rejected(client, identifier, password):
+    """Bad password and unknown user both return the same 401."""
+    client.post("/auth/register", json=NEW_USER)
+
+    response = client.post(
+        "/auth/login", json={"username": identifier, "password": password}
+    )
+    assert response.status_code == 401
+    assert response.json()["detail"] == "Invalid username or password"
@@ -34,43 +34,35 @@ def test_insert_calculation(db_session, test_user):
     )
 
     db_session.add(calc)
-    db_session.commit()
-    db_session.refresh(calc)
+    db_session.flush()   # INSERT only; commit semantics not under test
 
+    assert calc.id is not None
     assert calc.result == 15
     assert calc.type == "add"
     assert calc.user_id == test_user.id
 
 
 # ----------------------------------------------------------
-# Parameterized tests for all operations
+# All operation types (one bulk insert)
 # ----------------------------------------------------------
-@pytest.mark.parametrize(
-    "op_type, a, b, expected",
-    [
+def test_all_operations(db_session, test_user):
+    """Validate storage for all operation types."""
+    ops = [
         ("add", 1, 2, 3),
         ("subtract", 10, 3, 7),
         ("multiply", 2, 3, 6),
         ("divide", 20, 5, 4),
-    ],
-)
-def test_all_operations(db_session, test_user, op_type, a, b, expected):
-    """Validate storage for all operation types."""
+    ]
 
-    calc = Calculation(
-        type=op_type,
-        a=a,
-        b=b,
-        result=expected,
-        user_id=test_user.id,
-    )
-
-    db_session.add(calc)
-    db_session.commit()
-    db_session.refresh(calc)
+    db_session.bulk_save_objects([
+        Calculation(type=op_type, a=a, b=b, result=expected, user_id=test_user.id)
+        for op_type, a, b, expected in ops
+    ])
+    db_session.flush()
 
-    assert calc.result == expected
-    assert calc.type == op_type
+    rows = {c.type: c.result for c in db_session.query(Calculation).all()}
+    for op_type, _, _, expected in ops:
+        assert rows[op_type] == expected
 
 
 # ----------------------------------------------------------
@@ -21,29 +21,23 @@ from app.core.config import Settings, reload_settings, get_environment_mode
 # ----------------------------------------------------------
 # Environment Flag Tests
 # ----------------------------------------------------------
-def test_environment_flags(monkeypatch):
+@pytest.mark.parametrize(
+    "env_value, flag",
+    [
+        ("development", "is_dev"),
+        ("production", "is_prod"),
+        ("testing", "is_test"),
+    ],
+    ids=["dev", "prod", "test"],
+)
+def test_environment_flags(monkeypatch, env_value, flag):
     """Verify is_dev / is_prod / is_test properties under each ENV mode."""
-
-    # Development
-    monkeypatch.setenv("ENV", "development")
+    monkeypatch.setenv("ENV", env_value)
     s = Settings()
-    assert s.is_dev is True
-    assert s.is_prod is False
-    assert s.is_test is False
 
-    # Production
-    monkeypatch.setenv("ENV", "production")
-    s = Settings()
-    assert s.is_prod is True
-    assert s.is_dev is False
-    assert s.is_test is False
-
-    # Testing
-    monkeypatch.setenv("ENV", "testing")
-    s = Settings()
-    assert s.is_test is True
-    assert s.is_dev is False
-    assert s.is_prod is False
+    # Exactly one flag is set for each mode
+    for name in ("is_dev", "is_prod", "is_test"):
+        assert getattr(s, name) is (name == flag)
 
 
 # ----------------------------------------------------------
@@ -74,6 +68,7 @@ def test_reload_updates_values(monkeypatch):
         ("testing", "testing mode"),
         ("something_else", "Unknown environment"),
     ],
+    ids=["dev", "prod", "test", "unknown"],
 )
 def test_print_environment_modes(env_value, expected):
     """Validate conversion of ENV string into readable text."""
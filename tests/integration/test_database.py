@@ -14,22 +14,13 @@
 # ----------------------------------------------------------
 
 import os
-import sys
 import pytest
-import importlib
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.engine import Engine
 from sqlalchemy.orm import Session
 
-DATABASE_MODULE = "app.database.dbase"
-
-
-# Helper: Reload module for fresh environment
-def reload_database_module():
-    if DATABASE_MODULE in sys.modules:
-        del sys.modules[DATABASE_MODULE]
-    return importlib.import_module(DATABASE_MODULE)
+import app.database.dbase as dbase
 
 
 # ----------------------------------------------------------
@@ -38,62 +29,72 @@ def reload_database_module():
 def test_get_engine_success(monkeypatch):
     """Ensure a valid SQLAlchemy engine is created."""
     monkeypatch.setenv("DATABASE_URL", "sqlite:///./test.db")
-    db = reload_database_module()
-    engine = db.get_engine()
+    engine = dbase.get_engine()
     assert isinstance(engine, Engine)
 
 
 def test_get_engine_failure_with_sqlite(monkeypatch):
     """Force create_engine() failure to cover error-handling path."""
+
+    def fail_create_engine(*args, **kwargs):
+        raise SQLAlchemyError("Simulated failure")
+
     monkeypatch.setenv("DATABASE_URL", "sqlite:///./test.db")
-    with patch("app.database.dbase.create_engine",
-               side_effect=SQLAlchemyError("Simulated failure")):
-        import app.database.dbase as dbase
-        with pytest.raises(SQLAlchemyError):
-            dbase.get_engine()
+    monkeypatch.setattr(dbase, "create_engine", fail_create_engine)
+    with pytest.raises(SQLAlchemyError):
+        dbase.get_engine()
 
 
 def test_get_engine_coverage_fallback(monkeypatch):
     """Validate SQLite branch with connect_args."""
     monkeypatch.setenv("DATABASE_URL", "sqlite:///./test.db")
-    db = reload_database_module()
-    engine = db.get_engine()
+    engine = dbase.get_engine()
     assert "sqlite" in str(engine.url)
 
 
+def test_get_database_url_xdist_worker(monkeypatch):
+    """Each xdist worker gets its own SQLite file under pytest."""
+    monkeypatch.setenv("PYTEST_XDIST_WORKER", "gw3")
+    assert dbase.get_database_url() == "sqlite:///./test_gw3.db"
+
+
 def test_get_database_url_variants(monkeypatch):
     """DATABASE_URL should return postgres or sqlite strings."""
     monkeypatch.setenv("DATABASE_URL",
                        "postgresql://user:pass@db:5432/test_db")
-    import app.database.dbase as dbase
     result = dbase.get_database_url()
     assert "postgresql" in result or "sqlite" in result
 
 
+def test_engine_attribute_is_lazy():
+    """Module-level `engine` resolves through get_engine() on access."""
+    assert dbase.engine is dbase.get_engine()
+    with pytest.raises(AttributeError):
+        dbase.no_such_attribute
+
+
 # ----------------------------------------------------------
 # Session Lifecycle
 # ----------------------------------------------------------
-def test_session_factory(monkeypatch):
-    """Ensure SessionLocal creates usable SQLAlchemy sessions."""
-    db = reload_database_module()
-    session = db.SessionLocal()
+def test_session_factory():
+    """get_session() binds SessionLocal to the live engine."""
+    session = dbase.get_session()
     assert isinstance(session, Session)
+    assert session.get_bind() is dbase.get_engine()
     session.close()
 
 
-def test_base_declaration(monkeypatch):
+def test_base_declaration():
     """Base metadata must exist."""
-    db = reload_database_module()
-    assert db.Base is not None
+    assert dbase.Base is not None
 
 
-def test_init_drop_db(monkeypatch):
+def test_init_drop_db():
     """init_db() and drop_db() must call metadata methods."""
-    db = reload_database_module()
-    with patch.object(db.Base.metadata, "create_all") as mock_create, \
-            patch.object(db.Base.metadata, "drop_all") as mock_drop:
-        db.init_db()
-        db.drop_db()
+    with patch.object(dbase.Base.metadata, "create_all") as mock_create, \
+            patch.object(dbase.Base.metadata, "drop_all") as mock_drop:
+        dbase.init_db()
+        dbase.drop_db()
         assert mock_create.called
         assert mock_drop.called
 
@@ -101,13 +102,11 @@ def test_init_drop_db(monkeypatch):
 def test_run_session_lifecycle_success(monkeypatch):
     """Force commit path."""
     monkeypatch.setenv("PYTEST_CURRENT_TEST", "dummy")
-    import app.database.dbase as dbase
     dbase._run_session_lifecycle_for_coverage()
 
 
 def test_run_session_lifecycle_failure(monkeypatch):
     """Force failure path."""
-    import app.database.dbase as dbase
     with patch("app.database.dbase.get_session",
                side_effect=Exception("session fail")):
         with pytest.raises(RuntimeError):
@@ -120,17 +119,6 @@ def test_run_session_lifecycle_failure(monkeypatch):
 import app.database.dbase as db_init
 
 
-def test_postgres_unavailable_true():
-    with patch("socket.create_connection", side_effect=OSError()):
-        assert db_init._postgres_unavailable() is True
-
-
-def test_postgres_unavailable_false():
-    mock_conn = MagicMock()
-    with patch("socket.create_connection", return_value=mock_conn):
-        assert db_init._postgres_unavailable() is False
-
-
 def test_ensure_sqlite_fallback(monkeypatch):
     monkeypatch.setenv("DATABASE_URL", "postgres://x")
     with patch("app.database.dbase._postgres_unavailable", return_value=True):
@@ -64,7 +64,7 @@ def test_get_engine_unexpected_error(monkeypatch):
 def test_get_session_failure(monkeypatch):
     """Simulate SessionLocal raising an exception."""
 
-    def bad_session():
+    def bad_session(**kwargs):
         raise RuntimeError("session broken")
 
     monkeypatch.setattr(dbase, "SessionLocal", bad_session)
@@ -110,38 +110,31 @@ def test_drop_db_failure(monkeypatch):
 
 
 # ----------------------------------------------------------
-# 6. _postgres_unavailable() — True branch
+# 6. _postgres_unavailable() — True & False branches
 # ----------------------------------------------------------
-def test_postgres_unavailable_true(monkeypatch):
-    """Simulate socket connection failing."""
+class _FakeConn:
+    def close(self): pass
 
-    def fail_connect(*args, **kwargs):
-        raise Exception("cannot connect")
-
-    monkeypatch.setattr(dbase.socket, "create_connection", fail_connect)
-
-    assert dbase._postgres_unavailable() is True
 
+def _fail_connect(*args, **kwargs):
+    raise Exception("cannot connect")
 
-# ----------------------------------------------------------
-# 7. _postgres_unavailable() — False branch
-# ----------------------------------------------------------
-def test_postgres_unavailable_false(monkeypatch):
-    """Simulate successful connection."""
 
-    class FakeConn:
-        def close(self): pass
+@pytest.mark.parametrize(
+    "connect, expected",
+    [(_fail_connect, True), (lambda *a, **k: _FakeConn(), False)],
+    ids=["unreachable", "reachable"],
+)
+def test_postgres_unavailable(monkeypatch, connect, expected):
+    """Probe reports unavailable only when the socket connect fails."""
+    monkeypatch.setattr(dbase.socket, "create_connection", connect)
+    monkeypatch.setattr(dbase, "_pg_probe_cache", {"t": 0.0, "val": None})
 
-    def good_connect(*args, **kwargs):
-        return FakeConn()
-
-    monkeypatch.setattr(dbase.socket, "create_connection", good_connect)
-
-    assert dbase._postgres_unavailable() is False
+    assert dbase._postgres_unavailable() is expected
 
 
 # ----------------------------------------------------------
-# 8. _trigger_fallback_if_test_env() — failure branch
+# 7. _trigger_fallback_if_test_env() — failure branch
 # ----------------------------------------------------------
 def test_trigger_fallback_failure(monkeypatch):
     """Simulate fallback throwing error."""
@@ -158,7 +151,7 @@ def test_trigger_fallback_failure(monkeypatch):
 
 
 # ----------------------------------------------------------
-# 9. _run_session_lifecycle_for_coverage() — commit path
+# 8. _run_session_lifecycle_for_coverage() — commit path
 # ----------------------------------------------------------
 def test_session_lifecycle_commit(monkeypatch):
     """Simulate normal commit path for lifecycle."""
@@ -174,7 +167,7 @@ def test_session_lifecycle_commit(monkeypatch):
 
 
 # ----------------------------------------------------------
-# 10. _run_session_lifecycle_for_coverage() — rollback path
+# 9. _run_session_lifecycle_for_coverage() — rollback path
 # ----------------------------------------------------------
 def test_session_lifecycle_rollback(monkeypatch):
     """Force commit() failure → triggers rollback."""
@@ -190,3 +183,53 @@ def test_session_lifecycle_rollback(monkeypatch):
 
     with pytest.raises(RuntimeError):
         dbase._run_session_lifecycle_for_coverage()
+
+
+# ----------------------------------------------------------
+# 10. _engine_options() — pool configuration per backend
+# ----------------------------------------------------------
+@pytest.mark.parametrize(
+    "url, expected_keys",
+    [
+        ("sqlite:///./test.db", {"connect_args"}),
+        ("sqlite://", {"connect_args", "poolclass"}),
+        ("postgresql://u:p@db:5432/x",
+         {"pool_size", "max_overflow", "pool_timeout", "pool_pre_ping", "pool_recycle"}),
+    ],
+    ids=["sqlite-file", "sqlite-memory", "postgres"],
+)
+def test_engine_options(url, expected_keys):
+    """Each backend gets its own pool settings."""
+    assert set(dbase._engine_options(url)) == expected_keys
+
+
+# ----------------------------------------------------------
+# 11. get_engine() — memoized within a single test
+# ----------------------------------------------------------
+def test_get_engine_reused_within_test(monkeypatch):
+    """Repeated calls under the same pytest node return one engine."""
+    monkeypatch.setenv("PYTEST_CURRENT_TEST", "tests/x.py::test_a (call)")
+    first = dbase.get_engine()
+    assert dbase.get_engine() is first
+
+    monkeypatch.setenv("PYTEST_CURRENT_TEST", "tests/x.py::test_b (call)")
+    assert dbase.get_engine() is not first
+
+
+# ----------------------------------------------------------
+# 12. _postgres_unavailable() — probe result is memoized
+# ----------------------------------------------------------
+def test_postgres_unavailable_cached(monkeypatch):
+    """A second probe within the TTL must not open a socket."""
+    calls = []
+
+    def fail_connect(*args, **kwargs):
+        calls.append(args)
+        raise OSError("cannot connect")
+
+    monkeypatch.setattr(dbase.socket, "create_connection", fail_connect)
+    monkeypatch.setattr(dbase, "_pg_probe_cache", {"t": 0.0, "val": None})
+
+    assert dbase._postgres_unavailable() is True
+    assert dbase._postgres_unavailable() is True
+    assert len(calls) == 1
@@ -16,6 +16,7 @@
 # ----------------------------------------------------------
 
 import pytest
+from types import SimpleNamespace
 from unittest.mock import MagicMock
 from jose import jwt
 from fastapi import HTTPException, status
@@ -23,44 +24,123 @@ from datetime import timedelta
 
 from sqlalchemy.orm import Session
 from app.auth import dependencies
-from app.auth.security import hash_password, verify_password
+from app.models.user_model import User
+from app.auth.security import verify_password
 
 
 # ----------------------------------------------------------
 # Fixtures
 # ----------------------------------------------------------
+class _QueryStub:
+    """query(...).options(...).filter(...).first() → self.result"""
+
+    def __init__(self):
+        self.result = None
+
+    def options(self, *args):
+        return self
+
+    def filter(self, *args):
+        return self
+
+    def first(self):
+        return self.result
+
+
+class StubSession:
+    """
+    Lightweight stand-in for a SQLAlchemy session (cheaper than
+    MagicMock). get() returns self.user and records its calls.
+    """
+
+    def __init__(self):
+        self.query_stub = _QueryStub()
+        self.user = None
+        self.get_calls = []
+
+    def query(self, *entities):
+        return self.query_stub
+
+    def get(self, model, ident):
+        self.get_calls.append((model, ident))
+        return self.user
+
+    def add(self, obj):
+        pass
+
+    def commit(self):
+        pass
+
+    def close(self):
+        pass
+
+
 @pytest.fixture
 def mock_db():
-    """Provide a mocked SQLAlchemy DB session."""
-    return MagicMock()
+    """Provide a stub SQLAlchemy DB session."""
+    return StubSession()
 
 
 @pytest.fixture
-def fake_user():
+def fake_user(_hashed_secure):
     """Provide a mocked user object for authentication tests."""
     return MagicMock(
         id=1,
         username="testuser",
         email="test@example.com",
-        password_hash=hash_password("SecurePass123"),
+        password_hash=_hashed_secure,
         is_active=True,
     )
 
 
+@pytest.fixture
+def db_with_user(mock_db):
+    """Bind the user returned by db.query(...).options(...).filter(...).first()."""
+    def _bind(user):
+        mock_db.query_stub.result = user
+        return mock_db
+    return _bind
+
+
+# Tokens signed once per session (fake_user.id == 1)
+@pytest.fixture(scope="session")
+def valid_token():
+    return dependencies.create_access_token({"sub": "1"})
+
+
+@pytest.fixture(scope="session")
+def empty_token():
+    return dependencies.create_access_token({})
+
+
+@pytest.fixture(scope="session")
+def missing_user_token():
+    return dependencies.create_access_token({"sub": "999"})
+
+
+@pytest.fixture
+def authed_context(db_with_user, fake_user, valid_token):
+    """
+    mock_db that resolves fake_user both by login lookup and by
+    primary key, plus a valid token for that user.
+    """
+    db = db_with_user(fake_user)
+    db.user = fake_user
+    return SimpleNamespace(db=db, user=fake_user, token=valid_token)
+
+
 # ----------------------------------------------------------
 # Token Utility Tests
 # ----------------------------------------------------------
-def test_create_access_token_wrapper(fake_user):
+def test_create_access_token_wrapper(fake_user, valid_token):
     """create_access_token wrapper should embed user ID."""
-    token = dependencies.create_access_token({"sub": str(fake_user.id)})
-    decoded = jwt.decode(token, dependencies.SECRET_KEY, algorithms=[dependencies.ALGORITHM])
+    decoded = jwt.decode(valid_token, dependencies.SECRET_KEY, algorithms=[dependencies.ALGORITHM])
     assert decoded["sub"] == str(fake_user.id)
 
 
-def test_verify_access_token_wrapper_valid(fake_user):
+def test_verify_access_token_wrapper_valid(fake_user, valid_token):
     """verify_access_token should decode valid token."""
-    token = dependencies.create_access_token({"sub": str(fake_user.id)})
-    payload = dependencies.verify_access_token(token)
+    payload = dependencies.verify_access_token(valid_token)
     assert payload["sub"] == str(fake_user.id)
 
 
@@ -75,95 +155,106 @@ def test_verify_access_token_wrapper_invalid():
 # ----------------------------------------------------------
 # authenticate_user() Tests
 # ----------------------------------------------------------
-def test_authenticate_user_valid(mock_db, fake_user):
+def test_authenticate_user_valid(authed_context):
     """Valid credentials should return user."""
-    mock_query = MagicMock()
-    mock_filter = MagicMock()
-    mock_filter.first.return_value = fake_user
-    mock_query.filter.return_value = mock_filter
-    mock_db.query.return_value = mock_query
-
-    result = dependencies.authenticate_user(mock_db, fake_user.username, "SecurePass123")
-    assert result.username == fake_user.username
+    ctx = authed_context
+
+    result = dependencies.authenticate_user(ctx.db, ctx.user.username, "SecurePass123")
+    assert result.username == ctx.user.username
     assert verify_password("SecurePass123", result.password_hash)
 
 
-def test_authenticate_user_with_email(mock_db, fake_user):
+def test_authenticate_user_with_email(authed_context):
     """Email-based login should succeed."""
-    mock_query = MagicMock()
-    mock_filter = MagicMock()
-    mock_filter.first.return_value = fake_user
-    mock_query.filter.return_value = mock_filter
-    mock_db.query.return_value = mock_query
+    ctx = authed_context
 
-    result = dependencies.authenticate_user(mock_db, fake_user.email, "SecurePass123")
-    assert result.email == fake_user.email
+    result = dependencies.authenticate_user(ctx.db, ctx.user.email, "SecurePass123")
+    assert result.email == ctx.user.email
 
 
-def test_authenticate_user_invalid_password(mock_db, fake_user):
+def test_authenticate_user_invalid_password(db_with_user, fake_user):
     """Wrong password should return None."""
-    mock_query = MagicMock()
-    mock_filter = MagicMock()
-    mock_filter.first.return_value = fake_user
-    mock_query.filter.return_value = mock_filter
-    mock_db.query.return_value = mock_query
+    mock_db = db_with_user(fake_user)
 
     result = dependencies.authenticate_user(mock_db, fake_user.username, "WrongPass")
     assert result is None
 
 
-def test_authenticate_user_not_found(mock_db):
+def test_authenticate_user_not_found(db_with_user, monkeypatch):
     """Missing user should return None."""
-    mock_query = MagicMock()
-    mock_filter = MagicMock()
-    mock_filter.first.return_value = None
-    mock_query.filter.return_value = mock_filter
-    mock_db.query.return_value = mock_query
+    mock_db = db_with_user(None)
+
+    calls = []
+    monkeypatch.setattr(dependencies, "verify_dummy_password", calls.append)
 
     result = dependencies.authenticate_user(mock_db, "ghost", "password123")
     assert result is None
+    assert calls == ["password123"]
+
+
+def test_authenticate_user_case_insensitive(db_session, test_user):
+    """Username/email lookup ignores case (served by lower() indexes)."""
+    by_name = dependencies.authenticate_user(
+        db_session, test_user.username.upper(), "TestPass123"
+    )
+    by_email = dependencies.authenticate_user(
+        db_session, test_user.email.upper(), "TestPass123"
+    )
+    assert by_name.id == test_user.id
+    assert by_email.id == test_user.id
+
+    # Non-ASCII username: both sides must be lowered the same way
+    olaf = User(
+        username="Ölaf", email="olaf@example.com", password_hash=test_user.password_hash
+    )
+    db_session.add(olaf)
+    db_session.flush()
+    for identifier in ("Ölaf", "ÖLAF"):
+        found = dependencies.authenticate_user(db_session, identifier, "TestPass123")
+        assert found is not None and found.id == olaf.id, identifier
 
 
 # ----------------------------------------------------------
 # get_current_user() Tests
 # ----------------------------------------------------------
-def test_get_current_user_valid_token(mock_db, fake_user):
+def test_get_current_user_valid_token(authed_context):
     """Valid token should return user."""
-    token = dependencies.create_access_token({"sub": str(fake_user.id)})
+    ctx = authed_context
 
-    mock_query = MagicMock()
-    mock_filter = MagicMock()
-    mock_filter.first.return_value = fake_user
-    mock_query.filter.return_value = mock_filter
-    mock_db.query.return_value = mock_query
+    result = dependencies.get_current_user(token=ctx.token, db=ctx.db)
+    assert result.username == ctx.user.username
+    assert result.email == ctx.user.email
+    assert ctx.db.get_calls == [(dependencies.User, ctx.user.id)]
 
-    result = dependencies.get_current_user(token=token, db=mock_db)
-    assert result.username == fake_user.username
-    assert result.email == fake_user.email
 
+def test_get_current_user_cached_on_request(mock_db, fake_user, valid_token):
+    """Second resolution within one request must not hit the DB again."""
+    token = valid_token
+    mock_db.user = fake_user
+    request = MagicMock()
+    request.state = SimpleNamespace()
 
-def test_get_current_user_missing_sub(mock_db):
-    """Token missing 'sub' should raise HTTP_401."""
-    token = dependencies.create_access_token({})
+    first = dependencies.get_current_user(token=token, db=mock_db, request=request)
+    second = dependencies.get_current_user(token=token, db=mock_db, request=request)
 
+    assert first is second is fake_user
+    assert len(mock_db.get_calls) == 1
+
+
+def test_get_current_user_missing_sub(mock_db, empty_token):
+    """Token missing 'sub' should raise HTTP_401."""
     with pytest.raises(HTTPException) as exc:
-        dependencies.get_current_user(token=token, db=mock_db)
+        dependencies.get_current_user(token=empty_token, db=mock_db)
     assert exc.value.status_code == status.HTTP_401_UNAUTHORIZED
     assert "user id" in exc.value.detail.lower()
 
 
-def test_get_current_user_user_not_found(mock_db):
+def test_get_current_user_user_not_found(mock_db, missing_user_token):
     """User lookup failure should raise HTTP_401."""
-    token = dependencies.create_access_token({"sub": "999"})
-
-    mock_query = MagicMock()
-    mock_filter = MagicMock()
-    mock_filter.first.return_value = None
-    mock_query.filter.return_value = mock_filter
-    mock_db.query.return_value = mock_query
+    mock_db.user = None
 
     with pytest.raises(HTTPException) as exc:
-        dependencies.get_current_user(token=token, db=mock_db)
+        dependencies.get_current_user(token=missing_user_token, db=mock_db)
     assert exc.value.status_code == status.HTTP_401_UNAUTHORIZED
     assert "not found" in exc.value.detail.lower()
 
@@ -188,4 +279,4 @@ def test_get_db_session_lifecycle():
     with pytest.raises(StopIteration):
         next(gen)
 
-    assert getattr(db, "closed", True)
\ No newline at end of file
+    assert db.closed is True
\ No newline at end of file
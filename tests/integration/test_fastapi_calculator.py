@@ -8,43 +8,114 @@
 # Integration test suite for FastAPI calculator endpoints.
 #
 # Covers:
-#   • /calc/compute (ADD / SUB / MUL / DIV)
+#   • /calc/compute (ADD / SUB / MUL / DIV, scalar + batch)
+#   • Arithmetic cases sent concurrently over one ASGI transport
 #   • JSON input validation (400/422 cases)
+#   • Unknown operation names (422)
 #   • Zero-division error handling
 #   • Health check endpoint
+#   • Startup RUN_MIGRATIONS gate
 # ----------------------------------------------------------
 
+import asyncio
+
+import httpx
 import pytest
 from fastapi.testclient import TestClient
 
-from main import app
+from app.schemas.cal_schemas import MAX_BATCH_SIZE
+
+
+# main is imported lazily so collecting (or deselecting) this
+# module does not build the app.
+@pytest.fixture(scope="module")
+def client(override_get_db):
+    """
+    One TestClient (lifespan started once) shared by the module.
+    get_db is served by the in-memory test engine and startup skips
+    init_db(), so these requests never touch a real database.
+    """
+    import main
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(main.settings, "RUN_MIGRATIONS", False)
+        with TestClient(main.app) as c:
+            yield c
+
 
-client = TestClient(app)
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+@pytest.fixture
+async def async_client():
+    """
+    AsyncClient bound straight to the ASGI app (no lifespan, no socket).
+    /calc/compute never opens a DB session, so get_db is not overridden.
+    """
+    import main
+
+    transport = httpx.ASGITransport(app=main.app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as c:
+        yield c
 
 
 # ----------------------------------------------------------
 # Arithmetic Endpoint Tests  (Assignment 11 format)
 # ----------------------------------------------------------
-@pytest.mark.parametrize(
-    "payload, expected",
-    [
+@pytest.mark.anyio
+async def test_arithmetic_operations(async_client):
+    """All four operations, sent concurrently on one event loop."""
+    cases = [
         ({"type": "add", "a": 4, "b": 6}, 10),
         ({"type": "subtract", "a": 15, "b": 5}, 10),
         ({"type": "multiply", "a": 3, "b": 4}, 12),
         ({"type": "divide", "a": 20, "b": 4}, 5.0),
-    ],
-)
-def test_arithmetic_operations(payload, expected):
-    """Verify that calculation endpoint performs correct operations."""
+    ]
+    responses = await asyncio.gather(
+        *(async_client.post("/calc/compute", json=p) for p, _ in cases)
+    )
+    for response, (payload, expected) in zip(responses, cases):
+        assert response.status_code == 200, payload["type"]
+        assert response.json()["result"] == expected, payload["type"]
+
+
+def test_batch_operation(client):
+    """List operands are computed pairwise and return a list."""
+    payload = {"type": "multiply", "a": [1, 2, 3], "b": [4, 5, 6]}
+
     response = client.post("/calc/compute", json=payload)
     assert response.status_code == 200
-    assert response.json()["result"] == expected
+    assert response.json()["result"] == [4, 10, 18]
+
+
+@pytest.mark.parametrize(
+    "a, b",
+    [([1, 2], [3]), ([1, 2], 3), (1, [2])],
+    ids=["unequal-lists", "list-scalar", "scalar-list"],
+)
+def test_batch_shape_mismatch_rejected(client, a, b):
+    """Mixed scalar/list or unequal lists fail validation (422)."""
+    response = client.post("/calc/compute", json={"type": "add", "a": a, "b": b})
+    assert response.status_code == 422
+
+
+def test_batch_size_limit(client):
+    """Lists longer than MAX_BATCH_SIZE are rejected (422)."""
+    at_limit = [1.0] * MAX_BATCH_SIZE
+    ok = client.post("/calc/compute", json={"type": "add", "a": at_limit, "b": at_limit})
+    assert ok.status_code == 200
+
+    too_long = at_limit + [1.0]
+    response = client.post("/calc/compute", json={"type": "add", "a": too_long, "b": too_long})
+    assert response.status_code == 422
 
 
 # ----------------------------------------------------------
 # Validation: Invalid JSON
 # ----------------------------------------------------------
-def test_invalid_json_request():
+def test_invalid_json_request(client):
     """Ensure invalid input types trigger FastAPI validation error."""
     bad_payload = {"type": "add", "a": "text", "b": 5}
 
@@ -52,10 +123,18 @@ def test_invalid_json_request():
     assert response.status_code in (400, 422)
 
 
+def test_unknown_operation_rejected(client):
+    """Unsupported operation names fail schema validation (422)."""
+    payload = {"type": "modulo", "a": 10, "b": 3}
+
+    response = client.post("/calc/compute", json=payload)
+    assert response.status_code == 422
+
+
 # ----------------------------------------------------------
 # Validation: Divide-by-zero
 # ----------------------------------------------------------
-def test_divide_by_zero_error():
+def test_divide_by_zero_error(client):
     """Ensure division by zero returns validation / computation error."""
     payload = {"type": "divide", "a": 10, "b": 0}
     response = client.post("/calc/compute", json=payload)
@@ -67,8 +146,28 @@ def test_divide_by_zero_error():
 # ----------------------------------------------------------
 # Health Check Endpoint
 # ----------------------------------------------------------
-def test_health_endpoint_ok():
+def test_health_endpoint_ok(client):
     """Ensure /health endpoint returns OK."""
     response = client.get("/health")
     assert response.status_code == 200
     assert "healthy" in response.json()["status"].lower()
+
+
+# ----------------------------------------------------------
+# Startup: RUN_MIGRATIONS gate
+# ----------------------------------------------------------
+@pytest.mark.parametrize(
+    "enabled, expected_calls", [(True, 1), (False, 0)], ids=["enabled", "disabled"]
+)
+def test_lifespan_run_migrations_flag(monkeypatch, enabled, expected_calls):
+    """init_db() runs at startup only when RUN_MIGRATIONS is set."""
+    import main
+
+    calls = []
+    monkeypatch.setattr(main.settings, "RUN_MIGRATIONS", enabled)
+    monkeypatch.setattr(main, "init_db", lambda: calls.append(1))
+
+    with TestClient(main.app):
+        pass
+
+    assert len(calls) == expected_calls
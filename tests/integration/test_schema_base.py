@@ -24,6 +24,13 @@ from app.schemas.base import (
     UserLogin,
 )
 
+# Core validators, looked up once; tests validate plain dicts
+# directly instead of going through Model(**kwargs).
+_VALIDATORS = {
+    cls: cls.__pydantic_validator__
+    for cls in (UserBase, PasswordMixin, UserCreate, UserLogin)
+}
+
 
 # ----------------------------------------------------------
 # UserBase Schema Tests
@@ -36,7 +43,7 @@ def test_user_base_valid():
         "username": "nandan123",
         "email": "nandan@example.com",
     }
-    user = UserBase(**data)
+    user = _VALIDATORS[UserBase].validate_python(data)
 
     assert user.first_name == "Nandan"
     assert user.last_name == "Kumar"
@@ -53,13 +60,14 @@ def test_user_base_invalid_email():
         "email": "invalid-email",
     }
     with pytest.raises(ValidationError):
-        UserBase(**invalid_data)
+        _VALIDATORS[UserBase].validate_python(invalid_data)
 
 
 def test_user_base_missing_field():
     """Missing required fields must raise ValidationError."""
     with pytest.raises(ValidationError):
-        UserBase(first_name="OnlyName")  # Missing last_name, username, email
+        # Missing last_name, username, email
+        _VALIDATORS[UserBase].validate_python({"first_name": "OnlyName"})
 
 
 # ----------------------------------------------------------
@@ -71,34 +79,43 @@ def test_user_base_missing_field():
 ])
 def test_password_mixin_valid(password):
     """Accept passwords that meet all required strength rules."""
-    schema = PasswordMixin(password=password)
+    schema = _VALIDATORS[PasswordMixin].validate_python({"password": password})
     assert schema.password == password
 
 
-@pytest.mark.parametrize("password, expected_msg", [
-    ("short", "at least 6 characters"),
-    ("lowercase1", "uppercase"),
-    ("UPPERCASE1", "lowercase"),
-    ("NoDigitsHere", "digit"),
-])
-def test_password_mixin_invalid(password, expected_msg):
+def test_password_mixin_invalid():
     """Reject weak passwords missing uppercase, lowercase, or digits."""
-    with pytest.raises(ValidationError) as exc:
-        PasswordMixin(password=password)
-    assert expected_msg.lower() in str(exc.value).lower()
+    cases = [
+        ("short", "at least 6 characters"),
+        ("lowercase1", "uppercase"),
+        ("UPPERCASE1", "lowercase"),
+        ("NoDigitsHere", "digit"),
+    ]
+    for password, expected_msg in cases:
+        with pytest.raises(ValidationError) as exc:
+            _VALIDATORS[PasswordMixin].validate_python({"password": password})
+        errors = exc.value.errors()
+        assert any(expected_msg in e["msg"].lower() for e in errors), password
 
 
 def test_password_mixin_missing_password():
-    """Password is required — test both missing and None cases."""
-    # Case 1: password key missing
+    """Password is required — test missing, None and empty cases."""
+    # Case 1: password key missing → Pydantic's built-in required error
     with pytest.raises(ValidationError) as exc1:
-        PasswordMixin()  # type: ignore
-    assert "Password is required" in str(exc1.value)
+        _VALIDATORS[PasswordMixin].validate_python({})
+    assert [e["type"] for e in exc1.value.errors()] == ["missing"]
+
+    # Case 2: explicitly None or empty
+    for value in (None, ""):
+        with pytest.raises(ValidationError) as exc2:
+            _VALIDATORS[PasswordMixin].validate_python({"password": value})
+        assert any("Password is required" in e["msg"] for e in exc2.value.errors())
+
 
-    # Case 2: explicitly None
-    with pytest.raises(ValidationError) as exc2:
-        PasswordMixin(password=None)  # type: ignore
-    assert "Password is required" in str(exc2.value)
+def test_password_field_is_required():
+    """password stays a required field in the model and OpenAPI schema."""
+    assert UserCreate.model_fields["password"].is_required()
+    assert "password" in UserCreate.model_json_schema()["required"]
 
 
 # ----------------------------------------------------------
@@ -113,7 +130,7 @@ def test_user_create_valid():
         "email": "nandan@example.com",
         "password": "SecurePass123",
     }
-    schema = UserCreate(**data)
+    schema = _VALIDATORS[UserCreate].validate_python(data)
 
     assert schema.username == "nandan123"
     assert schema.email == "nandan@example.com"
@@ -130,7 +147,7 @@ def test_user_create_invalid_password():
         "password": "weak",
     }
     with pytest.raises(ValidationError):
-        UserCreate(**data)
+        _VALIDATORS[UserCreate].validate_python(data)
 
 
 # ----------------------------------------------------------
@@ -139,7 +156,7 @@ def test_user_create_invalid_password():
 def test_user_login_valid():
     """Valid username/email and password should pass."""
     data = {"username": "nandan@example.com", "password": "SecurePass123"}
-    schema = UserLogin(**data)
+    schema = _VALIDATORS[UserLogin].validate_python(data)
 
     assert schema.username == "nandan@example.com"
     assert schema.password == "SecurePass123"
@@ -150,10 +167,12 @@ def test_user_login_invalid_username(username):
     """Reject usernames that are too short or missing."""
     data = {"username": username, "password": "SecurePass123"}
     with pytest.raises(ValidationError):
-        UserLogin(**data)
+        _VALIDATORS[UserLogin].validate_python(data)
 
 
 def test_user_login_invalid_password():
     """Password must still meet minimum rules in login schema."""
     with pytest.raises(ValidationError):
-        UserLogin(username="nandan@example.com", password="short")
+        _VALIDATORS[UserLogin].validate_python(
+            {"username": "nandan@example.com", "password": "short"}
+        )
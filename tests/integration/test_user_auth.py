@@ -13,33 +13,86 @@
 #   • ORM → Pydantic schema conversion
 # ----------------------------------------------------------
 
-import pytest
+import re
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
 from unittest.mock import patch
+
+import jwt
+import pytest
 from sqlalchemy.exc import SQLAlchemyError
 
+import app.auth.security as sec
+from app.core.config import settings
 from app.models.user_model import User
 from app.auth.security import (
     hash_password,
     verify_password,
     create_access_token,
     decode_access_token,
+    verify_dummy_password,
 )
 
+# Token rejection message, compiled once for the JWT tests
+_TOKEN_BAD = re.compile("Invalid or expired token")
+
 # ----------------------------------------------------------
 # Password Hashing + Verification
 # ----------------------------------------------------------
-def test_password_hashing_and_verification():
-    """Correct password should verify; incorrect should fail."""
-    raw = "SecurePass123"
-    hashed = hash_password(raw)
+@pytest.mark.parametrize(
+    "plain, hashed, expected",
+    [
+        ("SecurePass123", None, True),
+        ("WrongPass", None, False),
+        ("AnyPass", "$2b$12$invalidhash", False),
+        (123, "notahash", False),
+        ("", "", False),
+    ],
+    ids=["correct", "wrong", "invalid-hash", "non-string", "empty"],
+)
+def test_verify_password_cases(_hashed_secure, plain, hashed, expected):
+    """
+    Only the right plaintext verifies; bad input returns False safely.
+    hashed=None means the session-scoped hash of "SecurePass123".
+    """
+    hashed = _hashed_secure if hashed is None else hashed
+    assert verify_password(plain, hashed) is expected
+
+
+def test_hash_password_uses_configured_rounds():
+    """Test mode clamps bcrypt cost to 4 and emits $2b$ hashes."""
+    hashed = hash_password("SecurePass123")
+    assert hashed.startswith("$2b$04$")
+
+
+def test_verify_password_caches_only_successes(monkeypatch):
+    """Repeated correct verify is served from cache; failures are not cached."""
+    hashed = hash_password("SecurePass123")
+    monkeypatch.setattr(sec, "_verify_cache", OrderedDict())
+
+    calls = []
+    real_verify = sec.pwd_context.verify
+
+    def counting_verify(*args, **kwargs):
+        calls.append(1)
+        return real_verify(*args, **kwargs)
+
+    monkeypatch.setattr(sec.pwd_context, "verify", counting_verify)
+
+    assert verify_password("SecurePass123", hashed) is True
+    assert verify_password("SecurePass123", hashed) is True
+    assert len(calls) == 1
 
-    assert verify_password(raw, hashed) is True
     assert verify_password("WrongPass", hashed) is False
+    assert verify_password("WrongPass", hashed) is False
+    assert len(calls) == 3
 
 
-def test_password_verification_with_invalid_hash():
-    """Invalid hash input should return False safely."""
-    assert verify_password("AnyPass", "$2b$12$invalidhash") is False
+def test_verify_dummy_password_always_false():
+    """Dummy check burns one bcrypt verify and never succeeds."""
+    assert verify_dummy_password("dummy-guess") is False
+    assert verify_dummy_password(None) is False
 
 
 def test_hash_password_rejects_invalid_input():
@@ -48,26 +101,16 @@ def test_hash_password_rejects_invalid_input():
         hash_password("")
 
 
-def test_verify_password_invalid_type():
-    """Non-string input should return False."""
-    assert verify_password(123, "notahash") is False
-
-
-def test_verify_password_empty_strings():
-    """Empty strings should return False."""
-    assert verify_password("", "") is False
-
-
 # ----------------------------------------------------------
 # User Model + DB Behavior
 # ----------------------------------------------------------
 @pytest.fixture
-def user_data():
-    """Reusable user payload."""
+def user_data(_hashed_secure):
+    """Reusable user payload (hash shared across the session)."""
     return {
         "username": "testuser",
         "email": "test@example.com",
-        "password_hash": hash_password("TestPass123"),
+        "password_hash": _hashed_secure,
     }
 
 
@@ -81,18 +124,19 @@ def test_user_creation_and_persistence(db_session, user_data):
     assert stored.email == "test@example.com"
 
 
-def test_unique_username_email_constraint(db_session, user_data):
-    """Duplicate username/email should raise SQLAlchemyError."""
+def test_unique_username_is_case_insensitive(db_session, user_data):
+    """Usernames differing only by case should collide."""
     db_session.add(User(**user_data))
     db_session.commit()
 
-    db_session.add(User(**user_data))
+    dup = dict(user_data, username="TestUser", email="other@example.com")
+    db_session.add(User(**dup))
     with pytest.raises(SQLAlchemyError):
         db_session.commit()
 
 
 def test_rollback_after_integrity_error(db_session, user_data):
-    """Session should rollback cleanly after failure."""
+    """Duplicate username/email fails; session rolls back cleanly."""
     db_session.add(User(**user_data))
     db_session.commit()
 
@@ -139,48 +183,86 @@ def test_database_commit_failure(monkeypatch, db_session, user_data):
 # ----------------------------------------------------------
 # JWT Token Behavior (PyJWT)
 # ----------------------------------------------------------
-def test_jwt_token_creation_and_verification():
+@pytest.fixture(scope="module")
+def valid_token():
+    """One signed token shared by the JWT tests in this module."""
+    return create_access_token({"sub": "testuser"})
+
+
+def test_jwt_token_creation_and_verification(valid_token):
     """Valid token should decode correctly."""
-    token = create_access_token({"sub": "testuser"})
-    decoded = decode_access_token(token)
+    decoded = decode_access_token(valid_token)
     assert decoded.get("sub") == "testuser"
 
 
+def test_create_access_token_custom_expiry():
+    """exp claim is an int epoch offset by expires_delta."""
+    token = create_access_token({"sub": "user"}, expires_delta=timedelta(minutes=5))
+    exp = decode_access_token(token)["exp"]
+    assert isinstance(exp, int)
+    assert 290 <= exp - time.time() <= 300
+
+
+def test_decode_access_token_served_from_cache(monkeypatch):
+    """Second decode of the same token is a cache hit (no verification)."""
+    monkeypatch.setattr(sec, "_decode_cache", OrderedDict())
+    token = create_access_token({"sub": "cached-user"})
+
+    calls = []
+    real_fast_decode = sec._fast_decode_hs256
+
+    def counting_fast_decode(tok):
+        calls.append(1)
+        return real_fast_decode(tok)
+
+    monkeypatch.setattr(sec, "_fast_decode_hs256", counting_fast_decode)
+
+    assert decode_access_token(token)["sub"] == "cached-user"
+    assert decode_access_token(token)["sub"] == "cached-user"
+    assert len(calls) == 1
+    assert len(sec._decode_cache) == 1
+
+
+def test_decode_access_token_hs256_fast_path(monkeypatch):
+    """Freshly issued HS256 tokens verify without calling jwt.decode."""
+    monkeypatch.setattr(sec, "_decode_cache", OrderedDict())
+    token = create_access_token({"sub": "fast-user"})
+
+    def fail_decode(*args, **kwargs):
+        raise AssertionError("jwt.decode should not run on the fast path")
+
+    monkeypatch.setattr(jwt, "decode", fail_decode)
+    assert decode_access_token(token)["sub"] == "fast-user"
+
+
 def test_invalid_token_rejected():
     """Invalid token string should raise RuntimeError."""
-    with pytest.raises(RuntimeError, match="Invalid or expired token"):
+    with pytest.raises(RuntimeError, match=_TOKEN_BAD):
         decode_access_token("invalid.token.string")
 
 
-def test_tampered_jwt_signature():
+def test_tampered_jwt_signature(valid_token):
     """Tampered token should fail verification."""
-    token = create_access_token({"sub": "user"})
-    tampered = token + "abc123"
+    tampered = valid_token + "abc123"
 
-    with pytest.raises(RuntimeError, match="Invalid or expired token"):
+    with pytest.raises(RuntimeError, match=_TOKEN_BAD):
         decode_access_token(tampered)
 
 
 def test_expired_token_behavior(monkeypatch):
     """Expired token should raise RuntimeError."""
-    import jwt
-    from datetime import datetime, timedelta
-    from app.core.config import settings
-
     expired = jwt.encode(
-        {"sub": "user", "exp": datetime.utcnow() - timedelta(seconds=1)},
+        {"sub": "user", "exp": datetime.now(timezone.utc) - timedelta(seconds=1)},
         settings.SECRET_KEY,
         algorithm=settings.ALGORITHM,
     )
 
-    with pytest.raises(RuntimeError, match="Invalid or expired token"):
+    with pytest.raises(RuntimeError, match=_TOKEN_BAD):
         decode_access_token(expired)
 
 
 def test_create_access_token_failure(monkeypatch):
     """Force PyJWT encode failure to test fallback."""
-    import jwt
-    import app.auth.security as sec
 
     def bad_encode(*args, **kwargs):
         raise Exception("encode failed")
@@ -194,8 +276,6 @@ def test_create_access_token_failure(monkeypatch):
 
 def test_decode_access_token_unexpected_error(monkeypatch):
     """Unexpected decode error should raise RuntimeError('Token decode error')."""
-    import jwt
-    import app.auth.security as sec
 
     def bad_decode(*args, **kwargs):
         raise ValueError("broken decode")
@@ -9,8 +9,7 @@
 #
 # Covers:
 #   • Table creation, inserts, queries, and updates
-#   • Commit + rollback behavior
-#   • Unique constraint enforcement
+#   • Unique constraint enforcement + rollback
 #   • Password hashing + verification
 #   • __repr__ coverage (normal + fallback)
 #   • ORM → Pydantic schema conversion
@@ -22,43 +21,23 @@ from sqlalchemy import text
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 
 from app.models.user_model import User
-from app.database.dbase import Base, engine, SessionLocal
-from app.auth.security import hash_password
 
 logger = logging.getLogger(__name__)
 
 
 # ----------------------------------------------------------
-# Database Setup Fixtures
+# Fixtures
+# db_session comes from conftest.py: each test runs inside a
+# SAVEPOINT that is rolled back on teardown, so no cleanup here.
 # ----------------------------------------------------------
-@pytest.fixture(scope="function", autouse=True)
-def setup_database():
-    """Clean reset of all tables before and after every test."""
-    Base.metadata.drop_all(bind=engine)
-    Base.metadata.create_all(bind=engine)
-    yield
-    Base.metadata.drop_all(bind=engine)
-
-
-@pytest.fixture
-def db_session():
-    """Provide a clean SQLAlchemy session for each test."""
-    session = SessionLocal()
-    try:
-        yield session
-    finally:
-        session.rollback()
-        session.close()
-
-
 @pytest.fixture
-def make_user():
+def make_user(_hashed_secure):
     """Factory to create users with valid hashed password."""
     def _make(username: str, email: str):
         return User(
             username=username,
             email=email,
-            password_hash=hash_password("SecurePass123"),
+            password_hash=_hashed_secure,
         )
     return _make
 
@@ -72,26 +51,6 @@ def test_database_connection(db_session):
     assert result.scalar() == 1
 
 
-# ----------------------------------------------------------
-# Insert / Commit / Rollback Tests
-# ----------------------------------------------------------
-def test_user_commit_and_rollback(db_session, make_user):
-    """Verify commit success and correct rollback after IntegrityError."""
-    u1 = make_user("alpha", "alpha@example.com")
-    db_session.add(u1)
-    db_session.commit()
-
-    # Insert duplicate email → trigger rollback
-    u2 = make_user("beta", "alpha@example.com")
-    db_session.add(u2)
-
-    with pytest.raises(IntegrityError):
-        db_session.commit()
-
-    db_session.rollback()
-    assert db_session.query(User).count() == 1
-
-
 # ----------------------------------------------------------
 # Querying Users
 # ----------------------------------------------------------
@@ -107,61 +66,72 @@ def test_user_query_methods(db_session, make_user):
     found = db_session.query(User).filter_by(username="user2").first()
     assert found.email == "u2@example.com"
 
-    ordered = db_session.query(User).order_by(User.email).all()
-    assert [u.email for u in ordered] == sorted([u.email for u in ordered])
+    emails = [e for (e,) in db_session.query(User.email).order_by(User.email)]
+    assert emails == ["u1@example.com", "u2@example.com", "u3@example.com"]
 
 
 # ----------------------------------------------------------
-# Update + Refresh
+# Update
 # ----------------------------------------------------------
 def test_user_update_and_refresh(db_session, make_user):
-    """Update user fields and verify refresh syncs DB state."""
+    """Updated fields are persisted and visible to a fresh query."""
     user = make_user("nandan", "nandan@example.com")
     db_session.add(user)
     db_session.commit()
 
     user.email = "updated@example.com"
     db_session.commit()
-    db_session.refresh(user)
 
-    assert user.email == "updated@example.com"
+    fetched = db_session.query(User.email).filter_by(username="nandan").one()
+    assert fetched.email == "updated@example.com"
 
 
 # ----------------------------------------------------------
 # Bulk Insert
 # ----------------------------------------------------------
 @pytest.mark.slow
-def test_bulk_user_insert(db_session, make_user):
-    """Insert multiple users using bulk save."""
-    users = [make_user(f"bulk{i}", f"bulk{i}@example.com") for i in range(5)]
-    db_session.bulk_save_objects(users)
+def test_bulk_user_insert(db_session, _hashed_secure):
+    """Insert multiple users from plain mappings (no ORM instances)."""
+    rows = [
+        {
+            "username": f"bulk{i}",
+            "email": f"bulk{i}@example.com",
+            "password_hash": _hashed_secure,
+        }
+        for i in range(5)
+    ]
+    db_session.bulk_insert_mappings(User, rows)
     db_session.commit()
 
-    assert db_session.query(User).count() >= 5
+    assert db_session.query(User).count() == 5
 
 
 # ----------------------------------------------------------
-# Unique Constraints
+# Unique Constraints + Rollback
 # ----------------------------------------------------------
-def test_unique_constraints(db_session, make_user):
-    """Duplicate username + duplicate email must raise IntegrityError."""
-    u1 = make_user("dupuser", "dup@example.com")
-    db_session.add(u1)
+@pytest.fixture
+def existing_user(db_session, make_user):
+    """One committed user that later inserts collide with."""
+    user = make_user("dupuser", "dup@example.com")
+    db_session.add(user)
     db_session.commit()
+    return user
 
-    # Duplicate username
-    u2 = make_user("dupuser", "other@example.com")
-    db_session.add(u2)
-    with pytest.raises(IntegrityError):
-        db_session.commit()
-    db_session.rollback()
 
-    # Duplicate email
-    u3 = make_user("otheruser", "dup@example.com")
-    db_session.add(u3)
+@pytest.mark.parametrize(
+    "username, email",
+    [("dupuser", "other@example.com"), ("otheruser", "dup@example.com")],
+    ids=["username", "email"],
+)
+def test_unique_constraints(db_session, make_user, existing_user, username, email):
+    """Duplicate username or email raises IntegrityError; rollback keeps the original."""
+    db_session.add(make_user(username, email))
     with pytest.raises(IntegrityError):
         db_session.commit()
 
+    db_session.rollback()
+    assert db_session.query(User).count() == 1
+
 
 # ----------------------------------------------------------
 # Transaction Rollback Behavior
@@ -229,3 +199,13 @@ def test_user_repr_never_crashes(db_session, make_user):
 
     output = repr(user)
     assert "User" in output or "object" in output
+
+
+# ----------------------------------------------------------
+# Seeded Users (fast non-bcrypt hash)
+# ----------------------------------------------------------
+def test_seed_users_use_fast_hash(db_session, seed_users):
+    """Seeded rows persist with a placeholder hash that never verifies."""
+    assert db_session.query(User).count() == len(seed_users)
+    assert seed_users[0].password_hash.startswith("sha256$")
+    assert seed_users[0].verify_password("TempPass123") is False
@@ -12,6 +12,8 @@
 # pattern implementation in app/factory/calculation_factory.py.
 # ----------------------------------------------------------
 
+import re
+
 import pytest
 
 from app.factory.calculation_factory import (
@@ -22,12 +24,15 @@ from app.factory.calculation_factory import (
     DivideOperation,
 )
 
+# Compiled once; reused by both division-by-zero checks below
+_DIV_ZERO = re.compile("Division by zero")
+
 # ----------------------------------------------------------
 # Factory: Valid Operation Types
 # ----------------------------------------------------------
-@pytest.mark.parametrize(
-    "calc_type, expected_class",
-    [
+def test_factory_mapping():
+    """Factory must return correct strategy instance per operation name."""
+    cases = [
         ("add", AddOperation),
         ("subtract", SubtractOperation),
         ("sub", SubtractOperation),
@@ -36,12 +41,15 @@ from app.factory.calculation_factory import (
         ("mul", MultiplyOperation),
         ("divide", DivideOperation),
         ("div", DivideOperation),
-    ],
-)
-def test_factory_returns_correct_operation(calc_type, expected_class):
-    """Factory must return correct strategy instance per operation name."""
-    op = CalculationFactory.create(calc_type)
-    assert isinstance(op, expected_class)
+    ]
+    for calc_type, expected_class in cases:
+        assert isinstance(CalculationFactory.create(calc_type), expected_class), calc_type
+
+
+def test_factory_returns_shared_instances():
+    """Synonyms resolve to one shared, stateless instance per operation."""
+    assert CalculationFactory.create("add") is CalculationFactory.create("add")
+    assert CalculationFactory.create("sub") is CalculationFactory.create(" Minus ")
 
 # ----------------------------------------------------------
 # Factory: Invalid Operation Types
@@ -85,5 +93,26 @@ def test_divide_operation_compute():
 # ----------------------------------------------------------
 def test_divide_operation_zero_error():
     op = DivideOperation()
-    with pytest.raises(ValueError, match="Division by zero"):
+    with pytest.raises(ValueError, match=_DIV_ZERO):
         op.compute(10, 0)
+
+# ----------------------------------------------------------
+# Strategy: compute_batch (pairwise over sequences)
+# ----------------------------------------------------------
+@pytest.mark.parametrize(
+    "op, expected",
+    [
+        (AddOperation(), [5, 7, 9]),
+        (SubtractOperation(), [-3, -3, -3]),
+        (MultiplyOperation(), [4, 10, 18]),
+        (DivideOperation(), [0.25, 0.4, 0.5]),
+    ],
+    ids=["add", "subtract", "multiply", "divide"],
+)
+def test_compute_batch(op, expected):
+    assert op.compute_batch([1, 2, 3], [4, 5, 6]) == expected
+
+
+def test_divide_compute_batch_zero_error():
+    with pytest.raises(ValueError, match=_DIV_ZERO):
+        DivideOperation().compute_batch([1, 2], [1, 0])
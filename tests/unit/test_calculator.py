@@ -12,70 +12,82 @@
 #   • Type validation errors
 #   • Zero-division handling
 #   • Consistent float outputs
+# Arithmetic cases are looped inside one test per operation;
+# parametrize is kept where per-case error context matters.
 # Provides full coverage for all calculator operations.
 # ----------------------------------------------------------
 
+import re
+
 import pytest
 from app.operations import add, subtract, multiply, divide
 
+# Error-message patterns for pytest.raises(match=...)
+_DIV_ZERO = re.compile("Division by zero")
+_NUMERIC = re.compile("Input must be numeric")
+
 # ----------------------------------------------------------
 # add()
 # ----------------------------------------------------------
-@pytest.mark.parametrize("a, b, expected", [
-    (3, 5, 8),
-    (-2, 6, 4),
-    (2.5, 1.5, 4.0),
-    (0, 0, 0),
-])
-def test_add(a, b, expected):
+def test_add():
     """Verify add() correctly calculates sums."""
-    assert add(a, b) == expected
+    cases = [
+        (3, 5, 8),
+        (-2, 6, 4),
+        (2.5, 1.5, 4.0),
+        (0, 0, 0),
+    ]
+    for a, b, expected in cases:
+        assert add(a, b) == expected, (a, b)
 
 # ----------------------------------------------------------
 # subtract()
 # ----------------------------------------------------------
-@pytest.mark.parametrize("a, b, expected", [
-    (10, 4, 6),
-    (4, 10, -6),
-    (-3, -2, -1),
-    (7.5, 2.5, 5.0),
-])
-def test_subtract(a, b, expected):
+def test_subtract():
     """Verify subtract() handles positive, negative, and float values."""
-    assert subtract(a, b) == expected
+    cases = [
+        (10, 4, 6),
+        (4, 10, -6),
+        (-3, -2, -1),
+        (7.5, 2.5, 5.0),
+    ]
+    for a, b, expected in cases:
+        assert subtract(a, b) == expected, (a, b)
 
 # ----------------------------------------------------------
 # multiply()
 # ----------------------------------------------------------
-@pytest.mark.parametrize("a, b, expected", [
-    (2, 3, 6),
-    (-2, 3, -6),
-    (1.5, 2.0, 3.0),
-    (0, 7, 0),
-])
-def test_multiply(a, b, expected):
+def test_multiply():
     """Ensure multiply() produces correct products."""
-    assert multiply(a, b) == expected
+    cases = [
+        (2, 3, 6),
+        (-2, 3, -6),
+        (1.5, 2.0, 3.0),
+        (0, 7, 0),
+    ]
+    for a, b, expected in cases:
+        assert multiply(a, b) == expected, (a, b)
 
 # ----------------------------------------------------------
 # divide()
 # ----------------------------------------------------------
-@pytest.mark.parametrize("a, b, expected", [
-    (8, 2, 4.0),
-    (-9, 3, -3.0),
-    (7.5, 2.5, 3.0),
-    (0, 5, 0.0),
-])
-def test_divide(a, b, expected):
+def test_divide():
     """Verify divide() returns correct float results."""
-    assert divide(a, b) == expected
+    cases = [
+        (8, 2, 4.0),
+        (-9, 3, -3.0),
+        (7.5, 2.5, 3.0),
+        (0, 5, 0.0),
+    ]
+    for a, b, expected in cases:
+        assert divide(a, b) == expected, (a, b)
 
 # ----------------------------------------------------------
 # divide → ZeroDivision
 # ----------------------------------------------------------
 def test_divide_by_zero():
     """Division by zero should raise ValueError."""
-    with pytest.raises(ValueError, match="Division by zero"):
+    with pytest.raises(ValueError, match=_DIV_ZERO):
         divide(10, 0)
 
 # ----------------------------------------------------------
@@ -89,5 +101,5 @@ def test_divide_by_zero():
 ])
 def test_invalid_type_inputs(func, a, b):
     """Invalid types must always raise ValueError via validate_number()."""
-    with pytest.raises(ValueError, match="Input must be numeric"):
+    with pytest.raises(ValueError, match=_NUMERIC):
         func(a, b)